@@ -2,10 +2,15 @@
 Command handlers utilities.
 """
 
-import configparser
+import functools
+import json
 import logging
-import random
+import os
+import queue
+import sys
+import threading
 import time
+from collections import Counter, namedtuple
 from typing import List
 
 from meshtastic import BROADCAST_NUM  # type: ignore
@@ -23,21 +28,285 @@ from db_operations import (
     get_sender_id_by_mail_id,
 )
 from utils import (
+    MessageBatch,
     get_node_id_from_num,
     get_node_info,
     get_node_short_name,
     send_message,
+    send_message_batch,
     update_user_state,
 )
 
-# Read the configuration for menu options
-config = configparser.ConfigParser()
-config.read("config.ini")
+CONFIG_JSON_FILE = "config.json"
+CONFIG_INI_FILE = "config.ini"
 
-main_menu_items = config["menu"]["main_menu_items"].split(",")
-bbs_menu_items = config["menu"]["bbs_menu_items"].split(",")
-utilities_menu_items = config["menu"]["utilities_menu_items"].split(",")
-service_name = config["service"]["name"]
+# Precomputed ASCII lowercase table so hot dispatch paths can normalize
+# commands with a single translate pass instead of a full str.lower call.
+_LOWER_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"
+)
+
+# Bulletin boards in menu order; indexed directly by the user's numeric choice.
+_BOARDS = ("General", "Info", "News", "Urgent")
+
+# Reverse lookup used to canonicalize user-supplied board names in O(1)
+# instead of scanning the board list per command.
+_BOARD_CANON = {b.lower(): b for b in _BOARDS}
+
+# Zero-padded labels "01".."99" for list numbering, precomputed so the
+# renderers index a tuple instead of running the format machinery per row.
+_NUM2 = tuple(f"{i:02d}" for i in range(1, 100))
+
+
+def _num2(i: int) -> str:
+    """
+    Return the zero-padded label for 1-based list position i + 1.
+
+    Args:
+        i (int): The 0-based row index.
+
+    Returns:
+        str: "01".."99" from the precomputed table, or a formatted
+        fallback for lists longer than 99 entries.
+    """
+    return _NUM2[i] if i < 99 else f"{i + 1:02d}"
+
+
+# Keep/delete/reply choices mapped to their canonical single letter.
+# Anything unrecognized falls back to keeping the message, matching the
+# handler's historical behaviour.
+_CHOICE_MAP = {"d": "d", "dx": "d", "r": "r", "rx": "r", "k": "k", "kx": "k"}
+
+# Canonical board object for the urgent-broadcast check; after
+# canonicalization through _BOARD_CANON an identity compare suffices.
+_URGENT = _BOARDS[3]
+
+# Quick commands all share the same ',,'-delimited shape, so the separator
+# and usage strings are defined once here instead of inline in each handler.
+_QC_SEP = ",,"
+
+USAGE_SM = "Send Mail Quick Command format:\nSM,,{short_name},,{subject},,{message}"
+USAGE_PB = "Post Bulletin Quick Command format:\nPB,,{board_name},,{subject},,{content}"
+USAGE_CB = "Check Bulletins Quick Command format:\nCB,,board_name"
+USAGE_CHP = "Post Channel Quick Command format:\nCHP,,{channel_name},,{channel_url}"
+
+QUICK_HELP = (
+    "QUICK COMMANDS\nSend command below for usage info:\nSM,, - Send "
+    "Mail\nCM - Check Mail\nPB,, - Post Bulletin\nCB,, - Check Bulletins\n"
+)
+
+# Static list-renderer headers and prompts, hoisted so the hot rendering
+# paths only join precomputed pieces. The prompts keep their leading
+# newline so joining leaves a blank line before them.
+_MAIL_LIST_HEADER = "You have the following messages:"
+_MAIL_LIST_PROMPT = "\nPlease reply with the number of the message you want to read."
+_BULLETIN_LIST_PROMPT = "\nPlease reply with the number of the bulletin you want to read."
+_CHANNEL_LIST_HEADER = "Available Channels:"
+_CHANNEL_LIST_PROMPT = "\nPlease reply with the number of the channel you want to view."
+
+
+def parse_quick_cmd(message: str, prefix_len: int, expected_parts: int) -> List[str] | None:
+    """
+    Split a quick command's payload on the ',,' separator and validate it.
+
+    The dispatcher has already matched the command tag, so the tag is
+    skipped with a slice instead of being split off and discarded.
+
+    Args:
+        message (str): The raw quick-command message, including the leading
+            command tag (e.g. "SM,,", "PB,,").
+        prefix_len (int): The length of the command tag plus separator.
+        expected_parts (int): The number of payload fields the command
+            must contain.
+
+    Returns:
+        List[str] | None: The payload fields when the message matches the
+        expected shape, otherwise None.
+    """
+    parts = message[prefix_len:].split(_QC_SEP, expected_parts - 1)
+    return parts if len(parts) == expected_parts else None
+
+
+# Sender identity resolved once per dispatch so handlers don't each walk
+# the node table for the same node id and short name.
+Sender = namedtuple("Sender", "num node_id short_name")
+
+
+class MailReadState:
+    """
+    Slim per-session record of the mail message currently being read.
+
+    Stored in user state between the read step and the keep/delete/reply
+    step. A slotted instance keeps long message bodies out of a per-field
+    dict and avoids re-hashing five string keys on every state update.
+    """
+
+    __slots__ = ("mail_id", "unique_id", "sender", "subject", "content")
+
+    def __init__(self, mail_id, unique_id, sender, subject, content):
+        self.mail_id = mail_id
+        self.unique_id = unique_id
+        self.sender = sender
+        self.subject = subject
+        self.content = content
+
+
+def resolve_sender(sender_id, interface) -> Sender:
+    """
+    Resolve a sender's node ID and short name once for a command dispatch.
+
+    Args:
+        sender_id (int): The numeric ID of the sending node.
+        interface (object): The interface object containing node information.
+
+    Returns:
+        Sender: The (num, node_id, short_name) tuple for the sender.
+    """
+    node_id = get_node_id_from_num(sender_id, interface)
+    return Sender(sender_id, node_id, get_node_short_name(node_id, interface))
+
+
+# Outbound notifications are delivered by a background worker so command
+# handlers never block on a slow or unreachable recipient link.
+_notification_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _notification_worker() -> None:
+    """
+    Deliver queued (text, destination, interface) notifications forever.
+    """
+    while True:
+        text, destination, interface = _notification_queue.get()
+        try:
+            send_message(text, destination, interface)
+        except Exception as e:  # pylint: disable = broad-except
+            # One undeliverable notification must not kill the worker
+            # that carries all of them.
+            logging.exception("Error delivering queued notification: %s", e)
+
+
+threading.Thread(
+    target=_notification_worker, name="notification-worker", daemon=True
+).start()
+
+
+def safe_handler(cmd_label, exceptions=(ValueError, KeyError, TypeError)):
+    """
+    Decorator providing the shared log-and-reply error handling for handlers.
+
+    Wrapping the handler body once here replaces the try/except/log/send
+    boilerplate previously repeated in every command handler, so the module
+    carries a single exception-handling code object instead of one per
+    handler.
+
+    Args:
+        cmd_label (str): Human-readable command name used in the error log
+            and the error reply.
+        exceptions (tuple): The exception types to catch.
+
+    Returns:
+        Callable: The decorating function.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(sender, *args, **kwargs):
+            try:
+                return fn(sender, *args, **kwargs)
+            except exceptions as e:  # pylint: disable = catching-non-exception
+                logging.error("Error processing %s: %s", cmd_label, e)
+                interface = kwargs.get("interface")
+                if interface is None:
+                    for arg in args:
+                        if hasattr(arg, "sendText"):
+                            interface = arg
+                            break
+                if interface is not None:
+                    destination = sender.num if isinstance(sender, Sender) else sender
+                    send_message(
+                        f"Error processing {cmd_label}.", destination, interface
+                    )
+                return None
+
+        return wrapper
+
+    return decorator
+
+
+_config_mtime: float = 0.0
+
+
+def _load_config() -> dict:
+    """
+    Load the menu configuration into plain Python structures.
+
+    A pre-parsed 'config.json' is preferred when present since json.load is
+    much faster than configparser; otherwise the function falls back to
+    reading 'config.ini'. The parsed values are returned as a dict with
+    pre-stripped menu item tuples so callers never need to re-strip them.
+
+    Returns:
+        dict: A dict with 'main_menu_items', 'bbs_menu_items',
+        'utilities_menu_items' tuples and the 'service_name' string.
+    """
+    global _config_mtime
+    if os.path.exists(CONFIG_JSON_FILE):
+        _config_mtime = os.stat(CONFIG_JSON_FILE).st_mtime
+        with open(CONFIG_JSON_FILE, "r", encoding="utf-8") as file:
+            raw = json.load(file)
+        menu = raw["menu"]
+        service = raw["service"]
+    else:
+        # configparser is only needed on the fallback path, so import it
+        # lazily to keep it off the cold-start path when config.json exists.
+        import configparser
+
+        _config_mtime = os.stat(CONFIG_INI_FILE).st_mtime
+        parser = configparser.ConfigParser()
+        parser.read(CONFIG_INI_FILE)
+        menu = {
+            "main_menu_items": parser["menu"]["main_menu_items"].split(","),
+            "bbs_menu_items": parser["menu"]["bbs_menu_items"].split(","),
+            "utilities_menu_items": parser["menu"]["utilities_menu_items"].split(","),
+        }
+        service = {"name": parser["service"]["name"]}
+    # Interned item strings make the dict lookups in build_menu hit the
+    # cached-hash / pointer-equality fast paths.
+    return {
+        "main_menu_items": tuple(
+            sys.intern(s.strip()) for s in menu["main_menu_items"]
+        ),
+        "bbs_menu_items": tuple(sys.intern(s.strip()) for s in menu["bbs_menu_items"]),
+        "utilities_menu_items": tuple(
+            sys.intern(s.strip()) for s in menu["utilities_menu_items"]
+        ),
+        "service_name": service["name"],
+    }
+
+
+# Read the configuration for menu options once at import time
+_config = _load_config()
+
+main_menu_items = _config["main_menu_items"]
+bbs_menu_items = _config["bbs_menu_items"]
+utilities_menu_items = _config["utilities_menu_items"]
+service_name = _config["service_name"]
+
+
+# Menu option labels keyed by the single-character item codes used in the
+# config. Labels are pre-newlined so build_menu can join them directly.
+_MENU_LABELS = {
+    "Q": "[Q]uick Commands\n",
+    "B": "[B]BS\n",
+    "U": "[U]tilities\n",
+    "X": "E[X]IT\n",
+    "M": "[M]ail\n",
+    "C": "[C]hannel Dir\n",
+    "J": "[J]S8CALL\n",
+    "S": "[S]tats\n",
+    "F": "[F]ortune\n",
+    "W": "[W]all of Shame\n",
+}
 
 
 def build_menu(items: List[str], menu_name: str):
@@ -51,29 +320,14 @@ def build_menu(items: List[str], menu_name: str):
     Returns:
         str: A formatted menu string with each item on a new line.
     """
-    menu_str = f"{menu_name}\n"
-    for item in items:
-        if item.strip() == "Q":
-            menu_str += "[Q]uick Commands\n"
-        elif item.strip() == "B":
-            menu_str += "[B]BS\n"
-        elif item.strip() == "U":
-            menu_str += "[U]tilities\n"
-        elif item.strip() == "X":
-            menu_str += "E[X]IT\n"
-        elif item.strip() == "M":
-            menu_str += "[M]ail\n"
-        elif item.strip() == "C":
-            menu_str += "[C]hannel Dir\n"
-        elif item.strip() == "J":
-            menu_str += "[J]S8CALL\n"
-        elif item.strip() == "S":
-            menu_str += "[S]tats\n"
-        elif item.strip() == "F":
-            menu_str += "[F]ortune\n"
-        elif item.strip() == "W":
-            menu_str += "[W]all of Shame\n"
-    return menu_str
+    return menu_name + "\n" + "".join(_MENU_LABELS.get(item, "") for item in items)
+
+
+# Menu bodies never change after config load; only the main menu title
+# (the mail count) varies per call, so cache the static parts once.
+_MAIN_MENU_BODY = "".join(_MENU_LABELS.get(item, "") for item in main_menu_items)
+_BBS_MENU = build_menu(bbs_menu_items, "Menu")
+_UTILITIES_MENU = build_menu(utilities_menu_items, "Utilities Menu")
 
 
 def handle_help_command(sender_id: int | str, interface, menu_name=None):
@@ -92,15 +346,15 @@ def handle_help_command(sender_id: int | str, interface, menu_name=None):
     if menu_name:
         update_user_state(sender_id, {"command": "MENU", "menu": menu_name, "step": 1})
         if menu_name == "bbs":
-            response = build_menu(bbs_menu_items, "Menu")
+            response = _BBS_MENU
         elif menu_name == "utilities":
-            response = build_menu(utilities_menu_items, "Utilities Menu")
+            response = _UTILITIES_MENU
     else:
         update_user_state(
             sender_id, {"command": "MAIN_MENU", "step": 1}
         )  # Reset to main menu state
         mail = get_mail(get_node_id_from_num(sender_id, interface))
-        response = build_menu(main_menu_items, f"{service_name} (✉️:{len(mail)})")
+        response = f"{service_name} (✉️:{len(mail)})\n" + _MAIN_MENU_BODY
     send_message(response, sender_id, interface)
 
 
@@ -189,36 +443,130 @@ def handle_stats_command(sender_id, interface):
     update_user_state(sender_id, {"command": "STATS", "step": 1})
 
 
+FORTUNES_FILE = "fortunes.txt"
+
+_fortunes: tuple | None = None
+_fortunes_mtime: float = 0.0
+
+
+def _load_fortunes() -> tuple:
+    """
+    Load the fortunes file into an in-memory cache.
+
+    The file is read once into a tuple of pre-stripped, non-blank lines;
+    subsequent calls only re-read it when the file's modification time
+    changes. This keeps file I/O and per-call stripping off the hot path
+    for the fortune command.
+
+    Returns:
+        tuple of str: The cached fortune lines.
+    """
+    global _fortunes, _fortunes_mtime
+    mtime = os.stat(FORTUNES_FILE).st_mtime
+    if _fortunes is None or mtime != _fortunes_mtime:
+        with open(FORTUNES_FILE, "r", encoding="utf-8") as file:
+            _fortunes = tuple(
+                line.rstrip() for line in file.read().splitlines() if line.strip()
+            )
+        _fortunes_mtime = mtime
+    return _fortunes
+
+
 def handle_fortune_command(sender_id, interface):
     """
     Handle the fortune command by sending a random fortune message to the sender.
 
-    This function reads fortunes from a file named 'fortunes.txt', selects a random fortune,
-    and sends it to the specified sender through the given interface. If the file is empty
-    or an error occurs, an appropriate error message is sent instead.
+    This function picks a random fortune from the cached contents of
+    'fortunes.txt' and sends it to the specified sender through the given
+    interface. If the file is empty or cannot be read, an appropriate error
+    message is sent instead.
 
     Args:
         sender_id (str): The ID of the sender to whom the fortune message will be sent.
         interface (object): The interface used to send the message.
-
-    Raises:
-        FileNotFoundError: If the 'fortunes.txt' file does not exist.
-        IOError: If there is an error reading the 'fortunes.txt' file.
-        ValueError: If there is an error processing the fortune data.
-        KeyError: If there is an error processing the fortune data.
-        TypeError: If there is an error processing the fortune data.
     """
+    import random
+
     try:
-        with open("fortunes.txt", "r", encoding="utf-8") as file:
-            fortunes = file.readlines()
-        if not fortunes:
-            send_message("No fortunes available.", sender_id, interface)
-            return
-        fortune = random.choice(fortunes).strip()
-        decorated_fortune = f"{fortune}"
-        send_message(decorated_fortune, sender_id, interface)
-    except (ValueError, KeyError, TypeError) as e:
+        fortunes = _load_fortunes()
+    except OSError as e:
         send_message(f"Error generating fortune: {e}", sender_id, interface)
+        return
+    if not fortunes:
+        send_message("No fortunes available.", sender_id, interface)
+        return
+    send_message(fortunes[random.randrange(len(fortunes))], sender_id, interface)
+
+
+def _stats_step_1(sender_id, message, interface):
+    """
+    Handles the stats menu choice: exit, node counts, hardware models or roles.
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The normalized message sent by the user.
+        interface (object): The interface object containing nodes and other relevant data.
+
+    Returns:
+        None
+    """
+    choice = message
+    if choice == "x":
+        handle_help_command(sender_id, interface)
+        return
+    elif choice == "n":
+        current_time = int(time.time())
+        limit_24h = current_time - 86400
+        limit_8h = current_time - 28800
+        limit_1h = current_time - 3600
+
+        # Single pass over the node table instead of one scan per timeframe
+        nodes_24h = nodes_8h = nodes_1h = 0
+        for node in interface.nodes.values():
+            last_heard = node.get("lastHeard")
+            if last_heard is None:
+                continue
+            if last_heard >= limit_24h:
+                nodes_24h += 1
+            if last_heard >= limit_8h:
+                nodes_8h += 1
+            if last_heard >= limit_1h:
+                nodes_1h += 1
+
+        response = (
+            "Total nodes seen:\n"
+            f"- All time: {len(interface.nodes)}\n"
+            f"- Last 24 hours: {nodes_24h}\n"
+            f"- Last 8 hours: {nodes_8h}\n"
+            f"- Last hour: {nodes_1h}"
+        )
+        send_message(response, sender_id, interface)
+        handle_stats_command(sender_id, interface)
+    elif choice == "h":
+        hw_models = Counter(
+            node["user"].get("hwModel", "Unknown")
+            for node in interface.nodes.values()
+        )
+        response = "Hardware Models:\n" + "\n".join(
+            f"{model}: {count}" for model, count in hw_models.items()
+        )
+        send_message(response, sender_id, interface)
+        handle_stats_command(sender_id, interface)
+    elif choice == "r":
+        roles = Counter(
+            node["user"].get("role", "Unknown")
+            for node in interface.nodes.values()
+        )
+        response = "Roles:\n" + "\n".join(
+            f"{role}: {count}" for role, count in roles.items()
+        )
+        send_message(response, sender_id, interface)
+        handle_stats_command(sender_id, interface)
+
+
+_STATS_STEP_HANDLERS = {
+    1: _stats_step_1,
+}
 
 
 def handle_stats_steps(sender_id, message, step, interface):
@@ -233,68 +581,223 @@ def handle_stats_steps(sender_id, message, step, interface):
 
     Returns:
         None
+    """
+    message = message.translate(_LOWER_TABLE)
+
+    handler = _STATS_STEP_HANDLERS.get(step)
+    if handler:
+        handler(sender_id, message, interface)
 
-    The function processes the user's message and performs different actions based on the step and the content of the message:
-    - If the message is 'x', it calls the help command handler.
-    - If the message is 'n', it calculates and sends the total number of nodes seen in different timeframes.
-    - If the message is 'h', it calculates and sends the count of different hardware models.
-    - If the message is 'r', it calculates and sends the count of different roles.
+
+def _bb_step_1(sender_id, message, state, interface, bbs_nodes):
     """
-    message = message.lower().strip()
-    if len(message) == 2 and message[1] == "x":
-        message = message[0]
+    Handles bulletin board selection (step 1).
 
-    if step == 1:
-        choice = message
-        if choice == "x":
-            handle_help_command(sender_id, interface)
-            return
-        elif choice == "n":
-            current_time = int(time.time())
-            timeframes = {
-                "All time": None,
-                "Last 24 hours": 86400,
-                "Last 8 hours": 28800,
-                "Last hour": 3600,
-            }
-            total_nodes_summary = []
-
-            for period, seconds in timeframes.items():
-                if seconds is None:
-                    total_nodes = len(interface.nodes)
-                else:
-                    time_limit = current_time - seconds
-                    total_nodes = sum(
-                        1
-                        for node in interface.nodes.values()
-                        if node.get("lastHeard") is not None
-                        and node["lastHeard"] >= time_limit
-                    )
-                total_nodes_summary.append(f"- {period}: {total_nodes}")
-
-            response = "Total nodes seen:\n" + "\n".join(total_nodes_summary)
-            send_message(response, sender_id, interface)
-            handle_stats_command(sender_id, interface)
-        elif choice == "h":
-            hw_models = {}
-            for node in interface.nodes.values():
-                hw_model = node["user"].get("hwModel", "Unknown")
-                hw_models[hw_model] = hw_models.get(hw_model, 0) + 1
-            response = "Hardware Models:\n" + "\n".join(
-                [f"{model}: {count}" for model, count in hw_models.items()]
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for sending and receiving messages.
+        bbs_nodes (list): The list of bulletin board system nodes.
+
+    Returns:
+        None
+    """
+    if message.lower() == "e":
+        handle_help_command(sender_id, interface, "bbs")
+        return
+    try:
+        board_index = int(message)
+    except ValueError:
+        board_index = -1
+    if not 0 <= board_index < len(_BOARDS):
+        send_message(
+            f"Invalid board number. Boards are: {', '.join(_BOARDS)}",
+            sender_id,
+            interface,
+        )
+        return
+    board_name = _BOARDS[board_index]
+    bulletins = get_bulletins(board_name)
+    response = f"{board_name} has {len(bulletins)} messages.\n[R]ead  [P]ost"
+    send_message(response, sender_id, interface)
+    update_user_state(
+        sender_id, {"command": "BULLETIN_ACTION", "step": 2, "board": board_name}
+    )
+
+
+def _bb_step_2(sender_id, message, state, interface, bbs_nodes):
+    """
+    Handles the read-or-post choice for the selected board (step 2).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for sending and receiving messages.
+        bbs_nodes (list): The list of bulletin board system nodes.
+
+    Returns:
+        None
+    """
+    board_name = state["board"]
+    choice = message.lower()
+    if choice == "r":
+        bulletins = get_bulletins(board_name)
+        if bulletins:
+            send_message(
+                f"Select a bulletin number to view from {board_name}:",
+                sender_id,
+                interface,
             )
-            send_message(response, sender_id, interface)
-            handle_stats_command(sender_id, interface)
-        elif choice == "r":
-            roles = {}
-            for node in interface.nodes.values():
-                role = node["user"].get("role", "Unknown")
-                roles[role] = roles.get(role, 0) + 1
-            response = "Roles:\n" + "\n".join(
-                [f"{role}: {count}" for role, count in roles.items()]
+            send_message_batch(
+                [f"[{bulletin[0]}] {bulletin[1]}" for bulletin in bulletins],
+                sender_id,
+                interface,
+            )
+            update_user_state(
+                sender_id,
+                {"command": "BULLETIN_READ", "step": 3, "board": board_name},
+            )
+        else:
+            send_message(f"No bulletins in {board_name}.", sender_id, interface)
+            return ("e", 1)
+    elif choice == "p":
+        if board_name.lower() == "urgent":
+            node_id = get_node_id_from_num(sender_id, interface)
+            allowed_nodes = interface.allowed_nodes
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(
+                    "Checking permissions for node_id: %s against %d allowed nodes",
+                    node_id,
+                    len(allowed_nodes),
+                )
+            if allowed_nodes and node_id not in allowed_nodes:
+                send_message(
+                    "You don't have permission to post to this board.",
+                    sender_id,
+                    interface,
+                )
+                return ("e", 1)
+        send_message(
+            "What is the subject of your bulletin? Keep it short.",
+            sender_id,
+            interface,
+        )
+        update_user_state(
+            sender_id, {"command": "BULLETIN_POST", "step": 4, "board": board_name}
+        )
+
+
+def _bb_step_3(sender_id, message, state, interface, bbs_nodes):
+    """
+    Sends the selected bulletin's content to the user (step 3).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for sending and receiving messages.
+        bbs_nodes (list): The list of bulletin board system nodes.
+
+    Returns:
+        None
+    """
+    bulletin_id = int(message)
+    # pylint: disable = unused-variable
+    sender_short_name, date, subject, content, unique_id = get_bulletin_content(
+        bulletin_id
+    )
+    send_message(
+        f"From: {sender_short_name}\nDate: {date}\nSubject: {subject}\n- - - - - - -\n{content}",
+        sender_id,
+        interface,
+    )
+    return ("e", 1)
+
+
+def _bb_step_4(sender_id, message, state, interface, bbs_nodes):
+    """
+    Records the subject of a new bulletin and prompts for its content (step 4).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for sending and receiving messages.
+        bbs_nodes (list): The list of bulletin board system nodes.
+
+    Returns:
+        None
+    """
+    subject = message
+    send_message(
+        "Send the contents of your bulletin. Send a message with END when finished.",
+        sender_id,
+        interface,
+    )
+    update_user_state(
+        sender_id,
+        {
+            "command": "BULLETIN_POST_CONTENT",
+            "step": 5,
+            "board": state["board"],
+            "subject": subject,
+            "content": "",
+        },
+    )
+
+
+def _bb_step_5(sender_id, message, state, interface, bbs_nodes):
+    """
+    Accumulates bulletin content and posts the bulletin on END (step 5).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for sending and receiving messages.
+        bbs_nodes (list): The list of bulletin board system nodes.
+
+    Returns:
+        None
+    """
+    if message.lower() == "end":
+        board = state["board"]
+        subject = state["subject"]
+        content = state["content"]
+        node_id = get_node_id_from_num(sender_id, interface)
+        node_info = interface.nodes.get(node_id)
+        if node_info is None:
+            send_message(
+                "Error: Unable to retrieve your node information.",
+                sender_id,
+                interface,
             )
-            send_message(response, sender_id, interface)
-            handle_stats_command(sender_id, interface)
+            update_user_state(sender_id, None)
+            return
+        sender_short_name = node_info["user"].get("shortName", f"Node {sender_id}")
+        unique_id = add_bulletin(
+            board, sender_short_name, subject, content, bbs_nodes, interface
+        )
+        send_message(
+            f"Your bulletin '{subject}' has been posted to {board}.\n(╯°□°)╯[{board}]",
+            sender_id,
+            interface,
+        )
+        return ("e", 1)
+    else:
+        state["content"] += message + "\n"
+        update_user_state(sender_id, state)
+
+
+_BB_STEP_HANDLERS = {
+    1: _bb_step_1,
+    2: _bb_step_2,
+    3: _bb_step_3,
+    4: _bb_step_4,
+    5: _bb_step_5,
+}
 
 
 def handle_bb_steps(sender_id, message, step, state, interface, bbs_nodes):
@@ -319,285 +822,184 @@ def handle_bb_steps(sender_id, message, step, state, interface, bbs_nodes):
     Returns:
     None
     """
-    boards = {0: "General", 1: "Info", 2: "News", 3: "Urgent"}
-    if step == 1:
-        if message.lower() == "e":
-            handle_help_command(sender_id, interface, "bbs")
+    # Step handlers return the next (message, step) pair instead of calling
+    # back into this function, so the return-to-menu transitions run in a
+    # loop rather than growing the call stack.
+    while True:
+        handler = _BB_STEP_HANDLERS.get(step)
+        if handler is None:
             return
-        board_name = boards[int(message)]
-        bulletins = get_bulletins(board_name)
-        response = f"{board_name} has {len(bulletins)} messages.\n[R]ead  [P]ost"
-        send_message(response, sender_id, interface)
-        update_user_state(
-            sender_id, {"command": "BULLETIN_ACTION", "step": 2, "board": board_name}
-        )
+        next_input = handler(sender_id, message, state, interface, bbs_nodes)
+        if next_input is None:
+            return
+        message, step = next_input
 
-    elif step == 2:
-        board_name = state["board"]
-        if message.lower() == "r":
-            bulletins = get_bulletins(board_name)
-            if bulletins:
-                send_message(
-                    f"Select a bulletin number to view from {board_name}:",
-                    sender_id,
-                    interface,
-                )
-                for bulletin in bulletins:
-                    send_message(f"[{bulletin[0]}] {bulletin[1]}", sender_id, interface)
-                update_user_state(
-                    sender_id,
-                    {"command": "BULLETIN_READ", "step": 3, "board": board_name},
-                )
-            else:
-                send_message(f"No bulletins in {board_name}.", sender_id, interface)
-                handle_bb_steps(sender_id, "e", 1, state, interface, bbs_nodes)
-        elif message.lower() == "p":
-            if board_name.lower() == "urgent":
-                node_id = get_node_id_from_num(sender_id, interface)
-                allowed_nodes = interface.allowed_nodes
-                logging.info(
-                    "Checking permissions for node_id: %s with allowed_nodes: %s",
-                    node_id,
-                    allowed_nodes,
-                )  # Debug statement
-                if allowed_nodes and node_id not in allowed_nodes:
-                    send_message(
-                        "You don't have permission to post to this board.",
-                        sender_id,
-                        interface,
-                    )
-                    handle_bb_steps(sender_id, "e", 1, state, interface, bbs_nodes)
-                    return
+
+def _mail_step_1(sender_id, message, state, interface, bbs_nodes):
+    """
+    Handles the read/send/exit choice in the mail menu (step 1).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
+
+    Returns:
+        None
+    """
+    choice = message.lower()
+    if choice == "r":
+        sender_node_id = get_node_id_from_num(sender_id, interface)
+        mail = get_mail(sender_node_id)
+        if mail:
             send_message(
-                "What is the subject of your bulletin? Keep it short.",
+                f"You have {len(mail)} mail messages. Select a message number to read:",
                 sender_id,
                 interface,
             )
-            update_user_state(
-                sender_id, {"command": "BULLETIN_POST", "step": 4, "board": board_name}
+            send_message_batch(
+                [
+                    f"-{msg[0]}-\nDate: {msg[3]}\nFrom: {msg[1]}\nSubject: {msg[2]}"
+                    for msg in mail
+                ],
+                sender_id,
+                interface,
+            )
+            update_user_state(sender_id, {"command": "MAIL", "step": 2})
+        else:
+            send_message(
+                "There are no messages in your mailbox.", sender_id, interface
             )
+            update_user_state(sender_id, None)
+    elif choice == "s":
+        send_message(
+            "What is the Short Name of the node you want to leave a message for?",
+            sender_id,
+            interface,
+        )
+        update_user_state(sender_id, {"command": "MAIL", "step": 3})
+    elif choice == "x":
+        handle_help_command(sender_id, interface)
 
-    elif step == 3:
-        bulletin_id = int(message)
-        # pylint: disable = unused-variable
-        sender_short_name, date, subject, content, unique_id = get_bulletin_content(
-            bulletin_id
+
+def _mail_step_2(sender_id, message, state, interface, bbs_nodes):
+    """
+    Sends the selected mail message and prompts for the next action (step 2).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
+
+    Returns:
+        None
+    """
+    mail_id = int(message)
+    try:
+        sender_node_id = get_node_id_from_num(sender_id, interface)
+        sender, date, subject, content, unique_id = get_mail_content(
+            mail_id, sender_node_id
         )
         send_message(
-            f"From: {sender_short_name}\nDate: {date}\nSubject: {subject}\n- - - - - - -\n{content}",
+            f"Date: {date}\nFrom: {sender}\nSubject: {subject}\n{content}",
             sender_id,
             interface,
         )
-        board_name = state["board"]
-        handle_bb_steps(sender_id, "e", 1, state, interface, bbs_nodes)
-
-    elif step == 4:
-        subject = message
         send_message(
-            "Send the contents of your bulletin. Send a message with END when finished.",
+            "What would you like to do with this message?\n[K]eep  [D]elete  [R]eply",
             sender_id,
             interface,
         )
         update_user_state(
             sender_id,
             {
-                "command": "BULLETIN_POST_CONTENT",
-                "step": 5,
-                "board": state["board"],
+                "command": "MAIL",
+                "step": 4,
+                "mail_id": mail_id,
+                "unique_id": unique_id,
+                "sender": sender,
                 "subject": subject,
-                "content": "",
+                "content": content,
             },
         )
-
-    elif step == 5:
-        if message.lower() == "end":
-            board = state["board"]
-            subject = state["subject"]
-            content = state["content"]
-            node_id = get_node_id_from_num(sender_id, interface)
-            node_info = interface.nodes.get(node_id)
-            if node_info is None:
-                send_message(
-                    "Error: Unable to retrieve your node information.",
-                    sender_id,
-                    interface,
-                )
-                update_user_state(sender_id, None)
-                return
-            sender_short_name = node_info["user"].get("shortName", f"Node {sender_id}")
-            unique_id = add_bulletin(
-                board, sender_short_name, subject, content, bbs_nodes, interface
-            )
-            send_message(
-                f"Your bulletin '{subject}' has been posted to {board}.\n(╯°□°)╯[{board}]",
-                sender_id,
-                interface,
-            )
-            handle_bb_steps(sender_id, "e", 1, state, interface, bbs_nodes)
-        else:
-            state["content"] += message + "\n"
-            update_user_state(sender_id, state)
+    except TypeError:
+        logging.info("Node %s tried to access non-existent message", sender_id)
+        send_message("Mail not found", sender_id, interface)
+        update_user_state(sender_id, None)
 
 
-def handle_mail_steps(sender_id, message, step, state, interface, bbs_nodes):
+def _mail_step_3(sender_id, message, state, interface, bbs_nodes):
     """
-    Handles the steps for the mail command in a multi-step process.
-
-    Parameters:
-    sender_id (str): The ID of the sender.
-    message (str): The message content sent by the user.
-    step (int): The current step in the mail handling process.
-    state (dict): The current state of the user.
-    interface (object): The interface object for communication.
-    bbs_nodes (list): List of BBS nodes.
+    Resolves the recipient node from its short name (step 3).
 
-    Steps:
-    1. Initial step where the user chooses to read, send, or exit mail.
-    2. User selects a mail to read.
-    3. User provides the short name of the node to send a message to.
-    4. User decides to keep, delete, or reply to a message.
-    5. User provides the subject of the message.
-    6. User selects a specific node if multiple nodes match the short name.
-    7. User writes the content of the message and sends it.
-    8. User confirms if they want to perform another mail command.
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
 
     Returns:
-    None
+        None
     """
-    message = message.strip()
-    if len(message) == 2 and message[1] == "x":
-        message = message[0]
+    short_name = message.lower()
+    nodes = get_node_info(interface, short_name)
+    if not nodes:
+        send_message(
+            "I'm unable to find that node in my database.", sender_id, interface
+        )
+        handle_mail_command(sender_id, interface)
+    elif len(nodes) == 1:
+        recipient_id = nodes[0]["num"]
+        recipient_name = get_node_name(recipient_id, interface)
+        send_message(
+            f"What is the subject of your message to {recipient_name}?\nKeep it short.",
+            sender_id,
+            interface,
+        )
+        update_user_state(
+            sender_id, {"command": "MAIL", "step": 5, "recipient_id": recipient_id}
+        )
+    else:
+        send_message(
+            "There are multiple nodes with that short name. Which one would you like to leave a message for?",
+            sender_id,
+            interface,
+        )
+        for i, node in enumerate(nodes):
+            send_message(f"[{i}] {node['longName']}", sender_id, interface)
+        update_user_state(sender_id, {"command": "MAIL", "step": 6, "nodes": nodes})
 
-    if step == 1:
-        choice = message.lower()
-        if choice == "r":
-            sender_node_id = get_node_id_from_num(sender_id, interface)
-            mail = get_mail(sender_node_id)
-            if mail:
-                send_message(
-                    f"You have {len(mail)} mail messages. Select a message number to read:",
-                    sender_id,
-                    interface,
-                )
-                for msg in mail:
-                    send_message(
-                        f"-{msg[0]}-\nDate: {msg[3]}\nFrom: {msg[1]}\nSubject: {msg[2]}",
-                        sender_id,
-                        interface,
-                    )
-                update_user_state(sender_id, {"command": "MAIL", "step": 2})
-            else:
-                send_message(
-                    "There are no messages in your mailbox.", sender_id, interface
-                )
-                update_user_state(sender_id, None)
-        elif choice == "s":
-            send_message(
-                "What is the Short Name of the node you want to leave a message for?",
-                sender_id,
-                interface,
-            )
-            update_user_state(sender_id, {"command": "MAIL", "step": 3})
-        elif choice == "x":
-            handle_help_command(sender_id, interface)
 
-    elif step == 2:
-        mail_id = int(message)
-        try:
-            sender_node_id = get_node_id_from_num(sender_id, interface)
-            sender, date, subject, content, unique_id = get_mail_content(
-                mail_id, sender_node_id
-            )
-            send_message(
-                f"Date: {date}\nFrom: {sender}\nSubject: {subject}\n{content}",
-                sender_id,
-                interface,
-            )
-            send_message(
-                "What would you like to do with this message?\n[K]eep  [D]elete  [R]eply",
-                sender_id,
-                interface,
-            )
-            update_user_state(
-                sender_id,
-                {
-                    "command": "MAIL",
-                    "step": 4,
-                    "mail_id": mail_id,
-                    "unique_id": unique_id,
-                    "sender": sender,
-                    "subject": subject,
-                    "content": content,
-                },
-            )
-        except TypeError:
-            logging.info("Node %s tried to access non-existent message", sender_id)
-            send_message("Mail not found", sender_id, interface)
-            update_user_state(sender_id, None)
-
-    elif step == 3:
-        short_name = message.lower()
-        nodes = get_node_info(interface, short_name)
-        if not nodes:
-            send_message(
-                "I'm unable to find that node in my database.", sender_id, interface
-            )
-            handle_mail_command(sender_id, interface)
-        elif len(nodes) == 1:
-            recipient_id = nodes[0]["num"]
-            recipient_name = get_node_name(recipient_id, interface)
-            send_message(
-                f"What is the subject of your message to {recipient_name}?\nKeep it short.",
-                sender_id,
-                interface,
-            )
-            update_user_state(
-                sender_id, {"command": "MAIL", "step": 5, "recipient_id": recipient_id}
-            )
-        else:
-            send_message(
-                "There are multiple nodes with that short name. Which one would you like to leave a message for?",
-                sender_id,
-                interface,
-            )
-            for i, node in enumerate(nodes):
-                send_message(f"[{i}] {node['longName']}", sender_id, interface)
-            update_user_state(sender_id, {"command": "MAIL", "step": 6, "nodes": nodes})
+def _mail_step_4(sender_id, message, state, interface, bbs_nodes):
+    """
+    Handles the keep/delete/reply choice for a read message (step 4).
 
-    elif step == 4:
-        if message.lower() == "d":
-            unique_id = state["unique_id"]
-            sender_node_id = get_node_id_from_num(sender_id, interface)
-            delete_mail(unique_id, sender_node_id, bbs_nodes, interface)
-            send_message("The message has been deleted 🗑️", sender_id, interface)
-            update_user_state(sender_id, None)
-        elif message.lower() == "r":
-            sender = state["sender"]
-            send_message(
-                f"Send your reply to {sender} now, followed by a message with END",
-                sender_id,
-                interface,
-            )
-            update_user_state(
-                sender_id,
-                {
-                    "command": "MAIL",
-                    "step": 7,
-                    "reply_to_mail_id": state['mail_id'],
-                    "subject": f"Re: {state['subject']}",
-                    "content": "",
-                },
-            )
-        else:
-            send_message(
-                "The message has been kept in your inbox.✉️", sender_id, interface
-            )
-            update_user_state(sender_id, None)
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
 
-    elif step == 5:
-        subject = message
+    Returns:
+        None
+    """
+    choice = message.lower()
+    if choice == "d":
+        unique_id = state["unique_id"]
+        sender_node_id = get_node_id_from_num(sender_id, interface)
+        delete_mail(unique_id, sender_node_id, bbs_nodes, interface)
+        send_message("The message has been deleted 🗑️", sender_id, interface)
+        update_user_state(sender_id, None)
+    elif choice == "r":
+        sender = state["sender"]
         send_message(
-            "Send your message. You can send it in multiple messages if it's too long for one.\nSend a single message with END when you're done",
+            f"Send your reply to {sender} now, followed by a message with END",
             sender_id,
             interface,
         )
@@ -606,73 +1008,193 @@ def handle_mail_steps(sender_id, message, step, state, interface, bbs_nodes):
             {
                 "command": "MAIL",
                 "step": 7,
-                "recipient_id": state["recipient_id"],
-                "subject": subject,
+                "reply_to_mail_id": state["mail_id"],
+                "subject": f"Re: {state['subject']}",
                 "content": "",
             },
         )
+    else:
+        send_message(
+            "The message has been kept in your inbox.✉️", sender_id, interface
+        )
+        update_user_state(sender_id, None)
 
-    elif step == 6:
-        selected_node_index = int(message)
-        selected_node = state["nodes"][selected_node_index]
-        recipient_id = selected_node["num"]
+
+def _mail_step_5(sender_id, message, state, interface, bbs_nodes):
+    """
+    Records the subject of a new message and prompts for its content (step 5).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
+
+    Returns:
+        None
+    """
+    subject = message
+    send_message(
+        "Send your message. You can send it in multiple messages if it's too long for one.\nSend a single message with END when you're done",
+        sender_id,
+        interface,
+    )
+    update_user_state(
+        sender_id,
+        {
+            "command": "MAIL",
+            "step": 7,
+            "recipient_id": state["recipient_id"],
+            "subject": subject,
+            "content": "",
+        },
+    )
+
+
+def _mail_step_6(sender_id, message, state, interface, bbs_nodes):
+    """
+    Picks one node when several share the requested short name (step 6).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
+
+    Returns:
+        None
+    """
+    selected_node_index = int(message)
+    selected_node = state["nodes"][selected_node_index]
+    recipient_id = selected_node["num"]
+    recipient_name = get_node_name(recipient_id, interface)
+    send_message(
+        f"What is the subject of your message to {recipient_name}?\nKeep it short.",
+        sender_id,
+        interface,
+    )
+    update_user_state(
+        sender_id, {"command": "MAIL", "step": 5, "recipient_id": recipient_id}
+    )
+
+
+def _mail_step_7(sender_id, message, state, interface, bbs_nodes):
+    """
+    Accumulates message content and delivers the mail on END (step 7).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
+
+    Returns:
+        None
+    """
+    if message.lower() == "end":
+        if "reply_to_mail_id" in state:
+            recipient_id = get_sender_id_by_mail_id(
+                state["reply_to_mail_id"]
+            )  # Get the sender ID from the mail ID
+        else:
+            recipient_id = state.get("recipient_id")
+        subject = state["subject"]
+        content = state["content"]
         recipient_name = get_node_name(recipient_id, interface)
+
+        sender_node_id = get_node_id_from_num(sender_id, interface)
+        sender_short_name = get_node_short_name(sender_node_id, interface)
+        unique_id = add_mail(
+            sender_node_id,
+            sender_short_name,
+            recipient_id,
+            subject,
+            content,
+            bbs_nodes,
+            interface,
+        )
         send_message(
-            f"What is the subject of your message to {recipient_name}?\nKeep it short.",
+            f"Mail has been posted to the mailbox of {recipient_name}.\n(╯°□°)╯",
             sender_id,
             interface,
         )
-        update_user_state(
-            sender_id, {"command": "MAIL", "step": 5, "recipient_id": recipient_id}
+
+        notification_message = f"You have a new mail message from {sender_short_name}. Check your mailbox by responding to this message with CM."
+        send_message(notification_message, recipient_id, interface)
+
+        update_user_state(sender_id, None)
+        update_user_state(sender_id, {"command": "MAIL", "step": 8})
+    else:
+        state["content"] += message + "\n"
+        update_user_state(sender_id, state)
+
+
+def _mail_step_8(sender_id, message, state, interface, bbs_nodes):
+    """
+    Asks whether the user wants to run another mail command (step 8).
+
+    Args:
+        sender_id (str): The ID of the sender.
+        message (str): The message content sent by the user.
+        state (dict): The current state of the user.
+        interface (object): The interface object for communication.
+        bbs_nodes (list): List of BBS nodes.
+
+    Returns:
+        None
+    """
+    if message.lower() == "y":
+        handle_mail_command(sender_id, interface)
+    else:
+        send_message(
+            "Okay, feel free to send another command.", sender_id, interface
         )
+        update_user_state(sender_id, None)
 
-    elif step == 7:
-        if message.lower() == "end":
-            if "reply_to_mail_id" in state:
-                recipient_id = get_sender_id_by_mail_id(
-                    state["reply_to_mail_id"]
-                )  # Get the sender ID from the mail ID
-            else:
-                recipient_id = state.get("recipient_id")
-            subject = state["subject"]
-            content = state["content"]
-            recipient_name = get_node_name(recipient_id, interface)
 
-            sender_short_name = get_node_short_name(
-                get_node_id_from_num(sender_id, interface), interface
-            )
-            unique_id = add_mail(
-                get_node_id_from_num(sender_id, interface),
-                sender_short_name,
-                recipient_id,
-                subject,
-                content,
-                bbs_nodes,
-                interface,
-            )
-            send_message(
-                f"Mail has been posted to the mailbox of {recipient_name}.\n(╯°□°)╯",
-                sender_id,
-                interface,
-            )
+_MAIL_STEP_HANDLERS = {
+    1: _mail_step_1,
+    2: _mail_step_2,
+    3: _mail_step_3,
+    4: _mail_step_4,
+    5: _mail_step_5,
+    6: _mail_step_6,
+    7: _mail_step_7,
+    8: _mail_step_8,
+}
+
+
+def handle_mail_steps(sender_id, message, step, state, interface, bbs_nodes):
+    """
+    Handles the steps for the mail command in a multi-step process.
 
-            notification_message = f"You have a new mail message from {sender_short_name}. Check your mailbox by responding to this message with CM."
-            send_message(notification_message, recipient_id, interface)
+    Parameters:
+    sender_id (str): The ID of the sender.
+    message (str): The message content sent by the user.
+    step (int): The current step in the mail handling process.
+    state (dict): The current state of the user.
+    interface (object): The interface object for communication.
+    bbs_nodes (list): List of BBS nodes.
 
-            update_user_state(sender_id, None)
-            update_user_state(sender_id, {"command": "MAIL", "step": 8})
-        else:
-            state["content"] += message + "\n"
-            update_user_state(sender_id, state)
+    Steps:
+    1. Initial step where the user chooses to read, send, or exit mail.
+    2. User selects a mail to read.
+    3. User provides the short name of the node to send a message to.
+    4. User decides to keep, delete, or reply to a message.
+    5. User provides the subject of the message.
+    6. User selects a specific node if multiple nodes match the short name.
+    7. User writes the content of the message and sends it.
+    8. User confirms if they want to perform another mail command.
 
-    elif step == 8:
-        if message.lower() == "y":
-            handle_mail_command(sender_id, interface)
-        else:
-            send_message(
-                "Okay, feel free to send another command.", sender_id, interface
-            )
-            update_user_state(sender_id, None)
+    Returns:
+    None
+    """
+    handler = _MAIL_STEP_HANDLERS.get(step)
+    if handler:
+        handler(sender_id, message, state, interface, bbs_nodes)
 
 
 def handle_wall_of_shame_command(sender_id, interface):
@@ -686,17 +1208,22 @@ def handle_wall_of_shame_command(sender_id, interface):
     Returns:
         None: Sends a message with the list of devices with low battery levels.
     """
-    response = "Devices with battery levels below 20%:\n"
-    # pylint: disable = unused-variable
-    for node_id, node in interface.nodes.items():
-        metrics = node.get("deviceMetrics", {})
-        battery_level = metrics.get("batteryLevel", 101)
-        if battery_level < 20:
-            long_name = node["user"]["longName"]
-            response += f"{long_name} - Battery {battery_level}%\n"
-    if response == "Devices with battery levels below 20%:\n":
-        response = "No devices with battery levels below 20% found."
-    send_message(response, sender_id, interface)
+    matches = [
+        f"{node['user']['longName']} - Battery {battery_level}%"
+        for node in interface.nodes.values()
+        if (battery_level := node.get("deviceMetrics", {}).get("batteryLevel", 101))
+        < 20
+    ]
+    if not matches:
+        send_message(
+            "No devices with battery levels below 20% found.", sender_id, interface
+        )
+        return
+    send_message(
+        "Devices with battery levels below 20%:\n" + "\n".join(matches),
+        sender_id,
+        interface,
+    )
 
 
 def handle_channel_directory_command(sender_id, interface):
@@ -736,16 +1263,12 @@ def handle_channel_directory_steps(sender_id, message, step, state, interface):
     Returns:
     None
     """
-    message = message.strip()
-    if len(message) == 2 and message[1] == "x":
-        message = message[0]
-
     if step == 1:
-        choice = message
-        if choice.lower() == "x":
+        choice = message.lower()
+        if choice == "x":
             handle_help_command(sender_id, interface)
             return
-        elif choice.lower() == "v":
+        elif choice == "v":
             channels = get_channels()
             if channels:
                 response = "Select a channel number to view:\n" + "\n".join(
@@ -753,20 +1276,21 @@ def handle_channel_directory_steps(sender_id, message, step, state, interface):
                 )
                 send_message(response, sender_id, interface)
                 update_user_state(
-                    sender_id, {"command": "CHANNEL_DIRECTORY", "step": 2}
+                    sender_id,
+                    {"command": "CHANNEL_DIRECTORY", "step": 2, "channels": channels},
                 )
             else:
                 send_message(
                     "No channels available in the directory.", sender_id, interface
                 )
                 handle_channel_directory_command(sender_id, interface)
-        elif choice.lower == "p":
+        elif choice == "p":
             send_message("Name your channel for the directory:", sender_id, interface)
             update_user_state(sender_id, {"command": "CHANNEL_DIRECTORY", "step": 3})
 
     elif step == 2:
         channel_index = int(message)
-        channels = get_channels()
+        channels = state["channels"]
         if 0 <= channel_index < len(channels):
             channel_name, channel_url = channels[channel_index]
             send_message(
@@ -798,13 +1322,14 @@ def handle_channel_directory_steps(sender_id, message, step, state, interface):
         handle_channel_directory_command(sender_id, interface)
 
 
-def handle_send_mail_command(sender_id, message, interface, bbs_nodes):
+@safe_handler("send mail command", (IOError,))
+def handle_send_mail_command(sender, message, interface, bbs_nodes):
     """
     Handles the 'send mail' command by parsing the message, validating the recipient,
     and sending the mail to the specified recipient.
 
     Args:
-        sender_id (int): The ID of the sender node.
+        sender (Sender): The resolved identity of the sending node.
         message (str): The message containing the mail command and its parameters.
         interface (object): The interface object used for communication.
         bbs_nodes (list): The list of BBS nodes.
@@ -813,7 +1338,6 @@ def handle_send_mail_command(sender_id, message, interface, bbs_nodes):
         None
 
     Raises:
-        configparser.Error: If there is an error in the configuration.
         IOError: If there is an I/O error.
 
     The expected format of the message is:
@@ -828,57 +1352,50 @@ def handle_send_mail_command(sender_id, message, interface, bbs_nodes):
         6. Notifies the recipient about the new mail.
         7. Handles any errors that occur during the process.
     """
-    try:
-        parts = message.split(",,", 3)
-        if len(parts) != 4:
-            send_message(
-                "Send Mail Quick Command format:\nSM,,{short_name},,{subject},,{message}",
-                sender_id,
-                interface,
-            )
-            return
-
-        _, short_name, subject, content = parts
-        nodes = get_node_info(interface, short_name.lower())
-        if not nodes:
-            send_message(
-                f"Node with short name '{short_name}' not found.", sender_id, interface
-            )
-            return
-        if len(nodes) > 1:
-            send_message(
-                f"Multiple nodes with short name '{short_name}' found. Please be more specific.",
-                sender_id,
-                interface,
-            )
-            return
-
-        recipient_id = nodes[0]["num"]
-        recipient_name = get_node_name(recipient_id, interface)
-        sender_short_name = get_node_short_name(
-            get_node_id_from_num(sender_id, interface), interface
+    parts = parse_quick_cmd(message, 4, 3)
+    if parts is None:
+        send_message(USAGE_SM, sender.num, interface)
+        return
+
+    short_name, subject, content = parts
+    nodes = get_node_info(interface, short_name.lower())
+    if not nodes:
+        send_message(
+            f"Node with short name '{short_name}' not found.", sender.num, interface
         )
-        # pylint: disable = unused-variable
-        unique_id = add_mail(
-            get_node_id_from_num(sender_id, interface),
-            sender_short_name,
-            recipient_id,
-            subject,
-            content,
-            bbs_nodes,
+        return
+    if len(nodes) > 1:
+        send_message(
+            f"Multiple nodes with short name '{short_name}' found. Please be more specific.",
+            sender.num,
             interface,
         )
-        send_message(f"Mail has been sent to {recipient_name}.", sender_id, interface)
+        return
 
-        notification_message = f"You have a new mail message from {sender_short_name}. Check your mailbox by responding to this message with CM."
-        send_message(notification_message, recipient_id, interface)
+    recipient_id = nodes[0]["num"]
+    # The node entry from the short-name lookup already carries the
+    # long name, so no second node-table walk is needed.
+    recipient_name = nodes[0]["longName"] or short_name
+    # pylint: disable = unused-variable
+    unique_id = add_mail(
+        sender.node_id,
+        sender.short_name,
+        recipient_id,
+        subject,
+        content,
+        bbs_nodes,
+        interface,
+    )
+    send_message(f"Mail has been sent to {recipient_name}.", sender.num, interface)
 
-    except (configparser.Error, IOError) as e:
-        logging.error("Error processing send mail command: %s", e)
-        send_message("Error processing send mail command.", sender_id, interface)
+    # Queue the recipient notification instead of sending it inline so
+    # the sender sees the confirmation without waiting on delivery.
+    notification_message = f"You have a new mail message from {sender.short_name}. Check your mailbox by responding to this message with CM."
+    _notification_queue.put((notification_message, recipient_id, interface))
 
 
-def handle_check_mail_command(sender_id, interface):
+@safe_handler("check mail command")
+def handle_check_mail_command(sender, interface):
     """
     Handles the 'check mail' command for a given sender.
 
@@ -888,34 +1405,36 @@ def handle_check_mail_command(sender_id, interface):
     state to indicate that they are in the process of checking their mail.
 
     Args:
-        sender_id (int): The ID of the sender requesting to check their mail.
+        sender (Sender): The resolved identity of the node checking its mail.
         interface (object): The interface object used to interact with the messaging system.
 
     Raises:
         Exception: If an error occurs while processing the command, it logs the error
                    and sends an error message to the sender.
     """
-    try:
-        sender_node_id = get_node_id_from_num(sender_id, interface)
-        mail = get_mail(sender_node_id)
-        if not mail:
-            send_message("You have no new messages.", sender_id, interface)
-            return
-
-        response = "You have the following messages:\n"
-        for i, msg in enumerate(mail):
-            response += f"{i + 1:02d}. From: {msg[1]}, Subject: {msg[2]}\n"
-        response += "\nPlease reply with the number of the message you want to read."
-        send_message(response, sender_id, interface)
-
-        update_user_state(sender_id, {"command": "CHECK_MAIL", "step": 1, "mail": mail})
-
-    except (ValueError, KeyError, TypeError) as e:
-        logging.error("Error processing check mail command: %s", e)
-        send_message("Error processing check mail command.", sender_id, interface)
+    mail = get_mail(sender.node_id)
+    if not mail:
+        send_message("You have no new messages.", sender.num, interface)
+        return
+
+    lines = [_MAIL_LIST_HEADER]
+    lines.extend(
+        f"{_num2(i)}. From: {msg[1]}, Subject: {msg[2]}"
+        for i, msg in enumerate(mail)
+    )
+    lines.append(_MAIL_LIST_PROMPT)
+    send_message("\n".join(lines), sender.num, interface)
+
+    # Keep only the row IDs in session state; the read step re-fetches
+    # one row by ID, so long message bodies aren't pinned per session
+    # and concurrent deletes can't leave stale rows behind.
+    update_user_state(
+        sender.num,
+        {"command": "CHECK_MAIL", "step": 1, "mail_ids": [m[0] for m in mail]},
+    )
 
 
-def handle_read_mail_command(sender_id, message, state, interface):
+def handle_read_mail_command(sender, message, state, interface):
     """
     Handles the 'read mail' command from a user.
 
@@ -924,7 +1443,7 @@ def handle_read_mail_command(sender_id, message, state, interface):
     It also updates the user's state to prompt for further actions on the mail.
 
     Args:
-        sender_id (str): The ID of the user who sent the command.
+        sender (Sender): The resolved identity of the user who sent the command.
         message (str): The message containing the mail number to be read.
         state (dict): The current state of the user, including the list of mails.
         interface (object): The interface used to send messages back to the user.
@@ -934,55 +1453,56 @@ def handle_read_mail_command(sender_id, message, state, interface):
         Exception: If any other error occurs during the processing of the command.
     """
     try:
-        mail = state.get("mail", [])
-        message_number = int(message) - 1
-
-        if message_number < 0 or message_number >= len(mail):
-            send_message(
-                "Invalid message number. Please try again.", sender_id, interface
-            )
-            return
-
-        mail_id = mail[message_number][0]
-        sender_node_id = get_node_id_from_num(sender_id, interface)
-        sender, date, subject, content, unique_id = get_mail_content(
-            mail_id, sender_node_id
-        )
-        response = f"Date: {date}\nFrom: {sender}\nSubject: {subject}\n\n{content}"
-        send_message(response, sender_id, interface)
+        message_number = int(message.strip()) - 1
+    except ValueError:
         send_message(
-            "What would you like to do with this message?\n[K]eep  [D]elete  [R]eply",
-            sender_id,
-            interface,
-        )
-        update_user_state(
-            sender_id,
-            {
-                "command": "CHECK_MAIL",
-                "step": 2,
-                "mail_id": mail_id,
-                "unique_id": unique_id,
-                "sender": sender,
-                "subject": subject,
-                "content": content,
-            },
+            "Invalid input. Please enter a valid message number.", sender.num, interface
         )
+        return
 
-    except ValueError:
+    mail_ids = state.get("mail_ids", [])
+    if message_number < 0 or message_number >= len(mail_ids):
         send_message(
-            "Invalid input. Please enter a valid message number.", sender_id, interface
+            "Invalid message number. Please try again.", sender.num, interface
+        )
+        return
+
+    mail_id = mail_ids[message_number]
+    # The DB read is the only real failure source left, so the try stays
+    # narrow around it and the validated happy path runs unguarded.
+    try:
+        mail_sender, date, subject, content, unique_id = get_mail_content(
+            mail_id, sender.node_id
         )
     except (KeyError, TypeError) as e:
         logging.error("Error processing read mail command: %s", e)
-        send_message("Error processing read mail command.", sender_id, interface)
+        send_message("Error processing read mail command.", sender.num, interface)
+        return
+
+    response = f"Date: {date}\nFrom: {mail_sender}\nSubject: {subject}\n\n{content}"
+    with MessageBatch(interface) as batch:
+        batch.send(response, sender.num)
+        batch.send(
+            "What would you like to do with this message?\n[K]eep  [D]elete  [R]eply",
+            sender.num,
+        )
+    update_user_state(
+        sender.num,
+        {
+            "command": "CHECK_MAIL",
+            "step": 2,
+            "mail_read": MailReadState(mail_id, unique_id, mail_sender, subject, content),
+        },
+    )
 
 
-def handle_delete_mail_confirmation(sender_id, message, state, interface, bbs_nodes):
+@safe_handler("delete mail confirmation")
+def handle_delete_mail_confirmation(sender, message, state, interface, bbs_nodes):
     """
     Handles the confirmation for deleting a mail message.
 
     Parameters:
-    sender_id (str): The ID of the sender.
+    sender (Sender): The resolved identity of the sender.
     message (str): The message containing the user's choice.
     state (dict): The current state of the user.
     interface (object): The interface object for communication.
@@ -994,51 +1514,43 @@ def handle_delete_mail_confirmation(sender_id, message, state, interface, bbs_no
     The function processes the user's choice to either delete the mail, reply to it, or keep it in the inbox.
     It updates the user state and sends appropriate messages based on the user's choice.
     """
-    try:
-        choice = message.lower().strip()
-        if len(choice) == 2 and choice[1] == "x":
-            choice = choice[0]
-
-        if choice == "d":
-            unique_id = state["unique_id"]
-            sender_node_id = get_node_id_from_num(sender_id, interface)
-            delete_mail(unique_id, sender_node_id, bbs_nodes, interface)
-            send_message("The message has been deleted", sender_id, interface)
-            update_user_state(sender_id, None)
-        elif choice == "r":
-            sender = state["sender"]
-            send_message(
-                f"Send your reply to {sender} now, followed by a message with END",
-                sender_id,
-                interface,
-            )
-            update_user_state(
-                sender_id,
-                {
-                    "command": "MAIL",
-                    "step": 7,
-                    "reply_to_mail_id": state["mail_id"],
-                    "subject": f"Re: {state['subject']}",
-                    "content": "",
-                },
-            )
-        else:
-            send_message(
-                "The message has been kept in your inbox.✉️", sender_id, interface
-            )
-            update_user_state(sender_id, None)
-
-    except (ValueError, KeyError, TypeError) as e:
-        logging.error("Error processing delete mail confirmation: %s", e)
-        send_message("Error processing delete mail confirmation.", sender_id, interface)
+    choice = _CHOICE_MAP.get(message.strip().translate(_LOWER_TABLE), "k")
+    mail_read = state["mail_read"]
+
+    if choice == "d":
+        delete_mail(mail_read.unique_id, sender.node_id, bbs_nodes, interface)
+        send_message("The message has been deleted", sender.num, interface)
+        update_user_state(sender.num, None)
+    elif choice == "r":
+        send_message(
+            f"Send your reply to {mail_read.sender} now, followed by a message with END",
+            sender.num,
+            interface,
+        )
+        update_user_state(
+            sender.num,
+            {
+                "command": "MAIL",
+                "step": 7,
+                "reply_to_mail_id": mail_read.mail_id,
+                "subject": f"Re: {mail_read.subject}",
+                "content": "",
+            },
+        )
+    else:
+        send_message(
+            "The message has been kept in your inbox.✉️", sender.num, interface
+        )
+        update_user_state(sender.num, None)
 
 
-def handle_post_bulletin_command(sender_id, message, interface, bbs_nodes):
+@safe_handler("post bulletin command")
+def handle_post_bulletin_command(sender, message, interface, bbs_nodes):
     """
     Handles the 'Post Bulletin' command by parsing the message, creating a bulletin, and sending appropriate responses.
 
     Args:
-        sender_id (int): The ID of the sender.
+        sender (Sender): The resolved identity of the sender.
         message (str): The message containing the bulletin details.
         interface (object): The interface used for communication.
         bbs_nodes (list): The list of bulletin board system nodes.
@@ -1051,41 +1563,39 @@ def handle_post_bulletin_command(sender_id, message, interface, bbs_nodes):
 
     If the board name is "urgent", a broadcast notification is sent to all users.
     """
-    try:
-        parts = message.split(",,", 3)
-        if len(parts) != 4:
-            send_message(
-                "Post Bulletin Quick Command format:\nPB,,{board_name},,{subject},,{content}",
-                sender_id,
-                interface,
-            )
-            return
-
-        _, board_name, subject, content = parts
-        sender_short_name = get_node_short_name(
-            get_node_id_from_num(sender_id, interface), interface
-        )
-        # pylint: disable = unused-variable
-        unique_id = add_bulletin(
-            board_name, sender_short_name, subject, content, bbs_nodes, interface
-        )
+    parts = parse_quick_cmd(message, 4, 3)
+    if parts is None:
+        send_message(USAGE_PB, sender.num, interface)
+        return
+
+    raw_board, subject, content = parts
+    board_name = _BOARD_CANON.get(raw_board.strip().lower())
+    if board_name is None:
         send_message(
-            f"Your bulletin '{subject}' has been posted to {board_name}.",
-            sender_id,
+            f"Invalid board name. Boards are: {', '.join(_BOARDS)}",
+            sender.num,
             interface,
         )
+        return
 
-        if board_name.lower() == "urgent":
-            notification_message = (
-                f"💥NEW URGENT BULLETIN\nFrom: {sender_short_name}\nTitle: {subject}"
-            )
-            send_message(notification_message, BROADCAST_NUM, interface)
+    # pylint: disable = unused-variable
+    unique_id = add_bulletin(
+        board_name, sender.short_name, subject, content, bbs_nodes, interface
+    )
+    send_message(
+        f"Your bulletin '{subject}' has been posted to {board_name}.",
+        sender.num,
+        interface,
+    )
 
-    except (ValueError, KeyError, TypeError) as e:
-        logging.error("Error processing post bulletin command: %s", e)
-        send_message("Error processing post bulletin command.", sender_id, interface)
+    if board_name is _URGENT:
+        notification_message = (
+            f"💥NEW URGENT BULLETIN\nFrom: {sender.short_name}\nTitle: {subject}"
+        )
+        send_message(notification_message, BROADCAST_NUM, interface)
 
 
+@safe_handler("check bulletin command")
 def handle_check_bulletin_command(sender_id, message, interface):
     """
     Handles the "Check Bulletin" command from a user.
@@ -1107,51 +1617,44 @@ def handle_check_bulletin_command(sender_id, message, interface):
     Returns:
         None
     """
-    try:
-        # Split the message only once
-        parts = message.split(",,", 1)
-        if len(parts) != 2 or not parts[1].strip():
-            send_message(
-                "Check Bulletins Quick Command format:\nCB,,board_name",
-                sender_id,
-                interface,
-            )
-            return
-
-        boards = {0: "General", 1: "Info", 2: "News", 3: "Urgent"}  # list of boards
-        board_name = (
-            parts[1].strip().capitalize()
-        )  # get board name from quick command and capitalize it
-        board_name = boards[
-            next(key for key, value in boards.items() if value == board_name)
-        ]  # search for board name in list
-
-        bulletins = get_bulletins(board_name)
-        if not bulletins:
-            send_message(
-                f"No bulletins available on {board_name} board.", sender_id, interface
-            )
-            return
+    parts = parse_quick_cmd(message, 4, 1)
+    if parts is None or not parts[0].strip():
+        send_message(USAGE_CB, sender_id, interface)
+        return
 
-        response = f"Bulletins on {board_name} board:\n"
-        for i, bulletin in enumerate(bulletins):
-            response += f"[{i+1:02d}] Subject: {bulletin[1]}, From: {bulletin[2]}, Date: {bulletin[3]}\n"
-        response += "\nPlease reply with the number of the bulletin you want to read."
-        send_message(response, sender_id, interface)
-
-        update_user_state(
+    board_name = _BOARD_CANON.get(parts[0].strip().lower())
+    if board_name is None:
+        send_message(
+            f"Invalid board name. Boards are: {', '.join(_BOARDS)}",
             sender_id,
-            {
-                "command": "CHECK_BULLETIN",
-                "step": 1,
-                "board_name": board_name,
-                "bulletins": bulletins,
-            },
+            interface,
+        )
+        return
+
+    bulletins = get_bulletins(board_name)
+    if not bulletins:
+        send_message(
+            f"No bulletins available on {board_name} board.", sender_id, interface
         )
+        return
 
-    except (ValueError, KeyError, TypeError) as e:
-        logging.error("Error processing check bulletin command: %s", e)
-        send_message("Error processing check bulletin command.", sender_id, interface)
+    lines = [f"Bulletins on {board_name} board:"]
+    lines.extend(
+        f"[{_num2(i)}] Subject: {bulletin[1]}, From: {bulletin[2]}, Date: {bulletin[3]}"
+        for i, bulletin in enumerate(bulletins)
+    )
+    lines.append(_BULLETIN_LIST_PROMPT)
+    send_message("\n".join(lines), sender_id, interface)
+
+    update_user_state(
+        sender_id,
+        {
+            "command": "CHECK_BULLETIN",
+            "step": 1,
+            "board_name": board_name,
+            "bulletin_ids": [b[0] for b in bulletins],
+        },
+    )
 
 
 def handle_read_bulletin_command(sender_id, message, state, interface):
@@ -1176,32 +1679,36 @@ def handle_read_bulletin_command(sender_id, message, state, interface):
         None
     """
     try:
-        bulletins = state.get("bulletins", [])
-        message_number = int(message) - 1
-
-        if message_number < 0 or message_number >= len(bulletins):
-            send_message(
-                "Invalid bulletin number. Please try again.", sender_id, interface
-            )
-            return
-
-        bulletin_id = bulletins[message_number][0]
-        # pylint: disable = unused-variable
-        sender, date, subject, content, unique_id = get_bulletin_content(bulletin_id)
-        response = f"Date: {date}\nFrom: {sender}\nSubject: {subject}\n\n{content}"
-        send_message(response, sender_id, interface)
-
-        update_user_state(sender_id, None)
-
+        message_number = int(message.strip()) - 1
     except ValueError:
         send_message(
             "Invalid input. Please enter a valid bulletin number.", sender_id, interface
         )
+        return
+
+    bulletin_ids = state.get("bulletin_ids", [])
+    if message_number < 0 or message_number >= len(bulletin_ids):
+        send_message(
+            "Invalid bulletin number. Please try again.", sender_id, interface
+        )
+        return
+
+    bulletin_id = bulletin_ids[message_number]
+    try:
+        # pylint: disable = unused-variable
+        sender, date, subject, content, unique_id = get_bulletin_content(bulletin_id)
     except (KeyError, TypeError) as e:
         logging.error("Error processing read bulletin command: %s", e)
         send_message("Error processing read bulletin command.", sender_id, interface)
+        return
+
+    response = f"Date: {date}\nFrom: {sender}\nSubject: {subject}\n\n{content}"
+    send_message(response, sender_id, interface)
+
+    update_user_state(sender_id, None)
 
 
+@safe_handler("post channel command")
 def handle_post_channel_command(sender_id, message, interface):
     """
     Handles the 'post channel' command by parsing the message and adding a new channel to the directory.
@@ -1223,46 +1730,34 @@ def handle_post_channel_command(sender_id, message, interface):
     If the channel is successfully added, a confirmation message is sent back to the sender.
     If an error occurs during processing, an error message is logged and sent back to the sender.
     """
-    try:
-        parts = message.split("|", 3)
-        if len(parts) != 3:
-            send_message(
-                "Post Channel Quick Command format:\nCHP,,{channel_name},,{channel_url}",
-                sender_id,
-                interface,
-            )
-            return
-
-        _, channel_name, channel_url = parts
-        bbs_nodes = interface.bbs_nodes
-        add_channel(channel_name, channel_url, bbs_nodes, interface)
-        send_message(
-            f"Channel '{channel_name}' has been added to the directory.",
-            sender_id,
-            interface,
-        )
-
-    except (ValueError, KeyError, TypeError) as e:
-        logging.error("Error processing post channel command: %s", e)
-        send_message("Error processing post channel command.", sender_id, interface)
+    parts = parse_quick_cmd(message, 5, 2)
+    if parts is None:
+        send_message(USAGE_CHP, sender_id, interface)
+        return
+
+    channel_name, channel_url = parts
+    bbs_nodes = interface.bbs_nodes
+    add_channel(channel_name, channel_url, bbs_nodes, interface)
+    send_message(
+        f"Channel '{channel_name}' has been added to the directory.",
+        sender_id,
+        interface,
+    )
 
 
-def handle_check_channel_command(sender_id, interface):
+def _render_channel_list(sender_id, interface, cmd_name, cmd_label):
     """
-    Handles the 'check channel' command by retrieving available channels and prompting the user to select one.
-
-    Args:
-        sender_id (str): The ID of the user who sent the command.
-        interface (object): The interface through which messages are sent and received.
+    Shared implementation for the channel listing commands.
 
-    Raises:
-        Exception: If there is an error processing the command.
+    Retrieves the channel directory, sends the numbered list to the user and
+    parks them in the given command state awaiting a channel selection.
 
-    The function performs the following steps:
-    1. Retrieves the list of available channels.
-    2. Sends a message to the user with the list of channels.
-    3. Updates the user's state to indicate that they are in the process of checking channels.
-    4. Logs and sends an error message if an exception occurs.
+    Args:
+        sender_id (str): The ID of the user who issued the command.
+        interface (object): The interface object used to send messages.
+        cmd_name (str): The state command name to store ("CHECK_CHANNEL"
+            or "LIST_CHANNELS").
+        cmd_label (str): Human-readable command name used in error messages.
     """
     try:
         channels = get_channels()
@@ -1272,19 +1767,31 @@ def handle_check_channel_command(sender_id, interface):
             )
             return
 
-        response = "Available Channels:\n"
-        for i, channel in enumerate(channels):
-            response += f"{i + 1:02d}. Name: {channel[0]}\n"
-        response += "\nPlease reply with the number of the channel you want to view."
-        send_message(response, sender_id, interface)
+        lines = [_CHANNEL_LIST_HEADER]
+        lines.extend(
+            f"{_num2(i)}. Name: {channel[0]}" for i, channel in enumerate(channels)
+        )
+        lines.append(_CHANNEL_LIST_PROMPT)
+        send_message("\n".join(lines), sender_id, interface)
 
         update_user_state(
-            sender_id, {"command": "CHECK_CHANNEL", "step": 1, "channels": channels}
+            sender_id, {"command": cmd_name, "step": 1, "channels": channels}
         )
 
-    except (ValueError, KeyError, TypeError) as e:
-        logging.error("Error processing check channel command: %s", e)
-        send_message("Error processing check channel command.", sender_id, interface)
+    except (ValueError, KeyError, TypeError, IOError) as e:
+        logging.error("Error processing %s command: %s", cmd_label, e)
+        send_message(f"Error processing {cmd_label} command.", sender_id, interface)
+
+
+def handle_check_channel_command(sender_id, interface):
+    """
+    Handles the 'check channel' command by retrieving available channels and prompting the user to select one.
+
+    Args:
+        sender_id (str): The ID of the user who sent the command.
+        interface (object): The interface through which messages are sent and received.
+    """
+    _render_channel_list(sender_id, interface, "CHECK_CHANNEL", "check channel")
 
 
 def handle_read_channel_command(sender_id, message, state, interface):
@@ -1349,31 +1856,8 @@ def handle_list_channels_command(sender_id, interface):
     Args:
         sender_id (str): The ID of the sender who issued the command.
         interface (object): The interface object used to send messages.
-
-    Raises:
-        Exception: If an error occurs while processing the command.
     """
-    try:
-        channels = get_channels()
-        if not channels:
-            send_message(
-                "No channels available in the directory.", sender_id, interface
-            )
-            return
-
-        response = "Available Channels:\n"
-        for i, channel in enumerate(channels):
-            response += f"{i+1:02d}. Name: {channel[0]}\n"
-        response += "\nPlease reply with the number of the channel you want to view."
-        send_message(response, sender_id, interface)
-
-        update_user_state(
-            sender_id, {"command": "LIST_CHANNELS", "step": 1, "channels": channels}
-        )
-
-    except (configparser.Error, IOError) as e:
-        logging.error("Error processing list channels command: %s", e)
-        send_message("Error processing list channels command.", sender_id, interface)
+    _render_channel_list(sender_id, interface, "LIST_CHANNELS", "list channels")
 
 
 def handle_quick_help_command(sender_id, interface):
@@ -1388,8 +1872,4 @@ def handle_quick_help_command(sender_id, interface):
     Returns:
         None
     """
-    response = (
-        "QUICK COMMANDS\nSend command below for usage info:\nSM,, - Send "
-        "Mail\nCM - Check Mail\nPB,, - Post Bulletin\nCB,, - Check Bulletins\n"
-    )
-    send_message(response, sender_id, interface)
+    send_message(QUICK_HELP, sender_id, interface)
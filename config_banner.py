@@ -2,9 +2,43 @@
 Print terminal banner utilities.
 """
 
+import functools
+
 from pyfiglet import Figlet  # type: ignore
 
 
+@functools.lru_cache(maxsize=4)
+def _get_figlet(font: str = "standard", width: int = 200) -> Figlet:
+    """
+    Return a cached Figlet renderer.
+
+    Constructing a Figlet parses a font file from disk, so the instance is
+    memoized and reused across banner renders.
+
+    Args:
+        font (str): The figlet font name.
+        width (int): The maximum render width.
+
+    Returns:
+        Figlet: The cached renderer for the given font and width.
+    """
+    return Figlet(font=font, width=width)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_banner(text: str) -> str:
+    """
+    Render banner text, caching the result for repeated texts.
+
+    Args:
+        text (str): The text to render.
+
+    Returns:
+        str: The rendered figlet banner.
+    """
+    return _get_figlet().renderText(text)
+
+
 def display_banner(text: str) -> None:
     """
     Displays a banner with the given text using the Figlet library.
@@ -15,5 +49,4 @@ def display_banner(text: str) -> None:
     Returns:
         None
     """
-    f = Figlet(width=200)
-    print(f.renderText(text))
+    print(_render_banner(text))
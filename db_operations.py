@@ -2,11 +2,14 @@
 Database utilities.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sqlite3
 import threading
 import uuid
-from datetime import datetime
+from contextlib import contextmanager
 from meshtastic import BROADCAST_NUM  # type: ignore
 from utils import (
     send_bulletin_to_bbs_nodes,
@@ -20,23 +23,153 @@ from utils import (
 
 thread_local = threading.local()
 
+# Connection PRAGMAs shared by every connection this module opens. WAL
+# lets readers run concurrently with writers, and synchronous=NORMAL
+# halves the fsync cost of each commit while remaining durable against
+# application crashes.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-8000;"
+    "PRAGMA busy_timeout=5000;"
+)
+
+# PRAGMAs for the read-only connections: journal_mode and synchronous
+# only matter for writes, and mode=ro connections may not change them.
+_RO_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-8000;"
+    "PRAGMA busy_timeout=5000;"
+)
+
+# SQL text kept byte-identical at module scope so sqlite3's per-connection
+# statement cache hits instead of re-parsing and re-planning per call.
+SQL_INSERT_CHANNEL = "INSERT INTO channels (name, url) VALUES (?, ?)"
+SQL_SELECT_CHANNELS = "SELECT name, url FROM channels"
+SQL_INSERT_BULLETIN = "INSERT INTO bulletins (board, sender_short_name, date, subject, content, unique_id) VALUES (?, ?, ?, ?, ?, ?)"
+# Single-row insert variants that let SQLite stamp the date, skipping the
+# Python-side strftime call on the accept hot path.
+SQL_INSERT_BULLETIN_NOW = "INSERT INTO bulletins (board, sender_short_name, date, subject, content, unique_id) VALUES (?, ?, strftime('%Y-%m-%d %H:%M','now','localtime'), ?, ?, ?)"
+SQL_SELECT_BULLETINS = "SELECT id, subject, sender_short_name, date, unique_id FROM bulletins WHERE board = ? COLLATE NOCASE"
+SQL_SELECT_BULLETIN_CONTENT = "SELECT sender_short_name, date, subject, content, unique_id FROM bulletins WHERE id = ?"
+SQL_DELETE_BULLETIN = "DELETE FROM bulletins WHERE id = ?"
+SQL_INSERT_MAIL = "INSERT INTO mail (sender, sender_short_name, recipient, date, subject, content, unique_id) VALUES (?, ?, ?, ?, ?, ?, ?)"
+SQL_INSERT_MAIL_NOW = "INSERT INTO mail (sender, sender_short_name, recipient, date, subject, content, unique_id) VALUES (?, ?, ?, strftime('%Y-%m-%d %H:%M','now','localtime'), ?, ?, ?)"
+SQL_SELECT_MAIL = "SELECT id, sender_short_name, subject, date, unique_id FROM mail WHERE recipient = ?"
+SQL_SELECT_MAIL_CONTENT = "SELECT sender_short_name, date, subject, content, unique_id FROM mail WHERE id = ? and recipient = ?"
+SQL_DELETE_MAIL = "DELETE FROM mail WHERE unique_id = ? RETURNING recipient"
+SQL_SELECT_MAIL_SENDER = "SELECT sender FROM mail WHERE id = ?"
+
 
 def get_db_connection():
     """
-    Retrieves a thread-local SQLite database connection.
+    Retrieves a thread-local read-only SQLite database connection.
 
     If a connection does not already exist for the current thread, a new one is created
     and stored in thread-local storage. This ensures that each thread has its own
-    separate database connection.
+    separate database connection. Every query helper in this module is a
+    pure read (writes all go through writer_conn), so the connection is
+    opened mode=ro: SQLite then skips lock escalation and never touches
+    the -wal/-shm files on these paths.
 
     Returns:
-        sqlite3.Connection: The SQLite database connection for the current thread.
+        sqlite3.Connection: The read-only connection for the current thread.
     """
     if not hasattr(thread_local, "connection"):
-        thread_local.connection = sqlite3.connect("bulletins.db")
+        conn = sqlite3.connect(
+            "file:bulletins.db?mode=ro", uri=True, cached_statements=256
+        )
+        conn.executescript(_RO_CONNECTION_PRAGMAS)
+        # C-implemented row view: cheap to build and readable by name,
+        # while still supporting the positional indexing callers use.
+        conn.row_factory = sqlite3.Row
+        thread_local.connection = conn
+        thread_local.cursor = conn.cursor()
     return thread_local.connection
 
 
+def get_cursor():
+    """
+    Return the reusable thread-local cursor, opening the connection first
+    if this thread has none.
+
+    Returns:
+        sqlite3.Cursor: The cursor cached for the current thread.
+    """
+    get_db_connection()
+    return thread_local.cursor
+
+
+# SQLite allows exactly one writer at a time, so all mutating helpers
+# funnel through one shared connection guarded by a lock instead of each
+# thread opening (and leaking) its own read/write handle. Reads keep
+# their per-thread connections and, under WAL, never block on the writer.
+_writer_lock = threading.Lock()
+_writer_connection = None
+
+
+@contextmanager
+def writer_conn():
+    """
+    Yield the process-wide writer connection, serialized by a lock.
+
+    The connection is opened lazily on first use with the same PRAGMAs
+    and statement cache as the reader connections.
+
+    Yields:
+        sqlite3.Connection: The shared read/write connection.
+    """
+    global _writer_connection
+    with _writer_lock:
+        if _writer_connection is None:
+            _writer_connection = sqlite3.connect(
+                "bulletins.db", cached_statements=256, check_same_thread=False
+            )
+            _writer_connection.executescript(_CONNECTION_PRAGMAS)
+            _writer_connection.row_factory = sqlite3.Row
+        yield _writer_connection
+
+
+# BBS-node fan-out sends happen off the caller's thread: the add/delete
+# helpers return as soon as the row is durable, and the radio sends (2s
+# pacing per chunk, times N nodes) drain from this queue in the background.
+_outbox: queue.Queue = queue.Queue()
+
+
+def _outbox_worker():
+    """
+    Drain queued fan-out sends, one (function, args) pair at a time.
+    """
+    while True:
+        fn, args = _outbox.get()
+        try:
+            fn(*args)
+        except Exception as e:  # pylint: disable = broad-except
+            # One bad payload must not kill the worker that owns all
+            # BBS sync fan-out for the rest of the process.
+            logging.exception("Error sending BBS sync message: %s", e)
+
+
+threading.Thread(target=_outbox_worker, daemon=True).start()
+
+
+def _optimize_on_exit():
+    """
+    Run PRAGMA optimize on the writer connection at shutdown so stale
+    planner statistics are refreshed after heavy insert/delete runs.
+    The thread-local connections are read-only and cannot persist stats.
+    """
+    if _writer_connection is not None:
+        try:
+            _writer_connection.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(_optimize_on_exit)
+
+
 def initialize_database():
     """
     Initializes the database by creating the necessary tables if they do not already exist.
@@ -48,10 +181,14 @@ def initialize_database():
 
     This function commits the changes to the database and prints a confirmation message once the schema is initialized.
     """
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        """CREATE TABLE IF NOT EXISTS bulletins (
+    # Schema setup is the one write that must happen before any reader
+    # opens its mode=ro connection, so it runs on the writer connection.
+    # One transaction for the whole batch: a single fsync instead of one
+    # per CREATE statement.
+    with writer_conn() as conn, conn:
+        c = conn.cursor()
+        c.execute(
+            """CREATE TABLE IF NOT EXISTS bulletins (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     board TEXT NOT NULL,
                     sender_short_name TEXT NOT NULL,
@@ -60,9 +197,9 @@ def initialize_database():
                     content TEXT NOT NULL,
                     unique_id TEXT NOT NULL
                 )"""
-    )
-    c.execute(
-        """CREATE TABLE IF NOT EXISTS mail (
+        )
+        c.execute(
+            """CREATE TABLE IF NOT EXISTS mail (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     sender TEXT NOT NULL,
                     sender_short_name TEXT NOT NULL,
@@ -72,15 +209,35 @@ def initialize_database():
                     content TEXT NOT NULL,
                     unique_id TEXT NOT NULL
                 );"""
-    )
-    c.execute(
-        """CREATE TABLE IF NOT EXISTS channels (
+        )
+        c.execute(
+            """CREATE TABLE IF NOT EXISTS channels (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
                     url TEXT NOT NULL
                 );"""
-    )
-    conn.commit()
+        )
+        # Indexes matching the hot filters: get_bulletins by board (NOCASE
+        # to match the query's collation), get_mail by recipient and
+        # delete_mail by unique_id would otherwise each scan the table.
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bulletins_board ON bulletins(board COLLATE NOCASE)"
+        )
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mail_recipient ON mail(recipient)"
+        )
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mail_uid ON mail(unique_id)"
+        )
+        # Covering indexes for the two list queries: SQLite can answer
+        # get_bulletins and get_mail from the index alone, skipping the
+        # table row fetch per result.
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bulletins_board_cov ON bulletins(board COLLATE NOCASE, id, subject, sender_short_name, date, unique_id)"
+        )
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mail_recipient_cov ON mail(recipient, id, sender_short_name, subject, date, unique_id)"
+        )
     print("Database schema initialized.")
 
 
@@ -97,13 +254,12 @@ def add_channel(name, url, bbs_nodes=None, interface=None):
     Returns:
         None
     """
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("INSERT INTO channels (name, url) VALUES (?, ?)", (name, url))
-    conn.commit()
+    with writer_conn() as conn:
+        conn.execute(SQL_INSERT_CHANNEL, (name, url))
+        conn.commit()
 
     if bbs_nodes and interface:
-        send_channel_to_bbs_nodes(name, url, bbs_nodes, interface)
+        _outbox.put((send_channel_to_bbs_nodes, (name, url, bbs_nodes, interface)))
 
 
 def get_channels():
@@ -118,8 +274,8 @@ def get_channels():
         and URL of a channel.
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("SELECT name, url FROM channels")
+    c = get_cursor()
+    c.execute(SQL_SELECT_CHANNELS)
     return c.fetchall()
 
 
@@ -141,19 +297,28 @@ def add_bulletin(
     Returns:
         str: The unique identifier of the added bulletin.
     """
-    conn = get_db_connection()
-    c = conn.cursor()
-    date = datetime.now().strftime("%Y-%m-%d %H:%M")
     if not unique_id:
         unique_id = str(uuid.uuid4())
-    c.execute(
-        "INSERT INTO bulletins (board, sender_short_name, date, subject, content, unique_id) VALUES (?, ?, ?, ?, ?, ?)",
-        (board, sender_short_name, date, subject, content, unique_id),
-    )
-    conn.commit()
+    with writer_conn() as conn:
+        conn.execute(
+            SQL_INSERT_BULLETIN_NOW,
+            (board, sender_short_name, subject, content, unique_id),
+        )
+        conn.commit()
     if bbs_nodes and interface:
-        send_bulletin_to_bbs_nodes(
-            board, sender_short_name, subject, content, unique_id, bbs_nodes, interface
+        _outbox.put(
+            (
+                send_bulletin_to_bbs_nodes,
+                (
+                    board,
+                    sender_short_name,
+                    subject,
+                    content,
+                    unique_id,
+                    bbs_nodes,
+                    interface,
+                ),
+            )
         )
 
     # New logic to send group chat notification for urgent bulletins
@@ -166,6 +331,28 @@ def add_bulletin(
     return unique_id
 
 
+def add_bulletins_bulk(rows):
+    """
+    Insert a batch of bulletins with one prepared statement and one commit.
+
+    Receive-side sync code that replays several bulletins should buffer
+    them and call this instead of add_bulletin per row: executemany reuses
+    a single prepared statement and the whole batch costs one fsync.
+
+    Args:
+        rows (list of tuple): Tuples of (board, sender_short_name, date,
+            subject, content, unique_id), matching the bulletins schema.
+
+    Returns:
+        None
+    """
+    if not rows:
+        return
+    with writer_conn() as conn:
+        with conn:
+            conn.executemany(SQL_INSERT_BULLETIN, rows)
+
+
 def get_bulletins(board):
     """
     Retrieve bulletins from the database for a specified board.
@@ -182,18 +369,19 @@ def get_bulletins(board):
             - unique_id (str): The unique identifier of the bulletin.
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        "SELECT id, subject, sender_short_name, date, unique_id FROM bulletins WHERE board = ? COLLATE NOCASE",
-        (board,),
-    )
+    c = get_cursor()
+    c.execute(SQL_SELECT_BULLETINS, (board,))
     return c.fetchall()
 
 
+@functools.lru_cache(maxsize=256)
 def get_bulletin_content(bulletin_id):
     """
     Retrieve the content of a bulletin from the database based on the bulletin ID.
 
+    Bulletins are immutable once posted, so results are memoized with a
+    bounded LRU cache; the cache is cleared when a bulletin is deleted.
+
     Args:
         bulletin_id (int): The ID of the bulletin to retrieve.
 
@@ -202,11 +390,8 @@ def get_bulletin_content(bulletin_id):
                Returns None if no bulletin is found with the given ID.
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        "SELECT sender_short_name, date, subject, content, unique_id FROM bulletins WHERE id = ?",
-        (bulletin_id,),
-    )
+    c = get_cursor()
+    c.execute(SQL_SELECT_BULLETIN_CONTENT, (bulletin_id,))
     return c.fetchone()
 
 
@@ -222,11 +407,11 @@ def delete_bulletin(bulletin_id, bbs_nodes, interface):
     Returns:
         None
     """
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("DELETE FROM bulletins WHERE id = ?", (bulletin_id,))
-    conn.commit()
-    send_delete_bulletin_to_bbs_nodes(bulletin_id, bbs_nodes, interface)
+    with writer_conn() as conn:
+        conn.execute(SQL_DELETE_BULLETIN, (bulletin_id,))
+        conn.commit()
+    get_bulletin_content.cache_clear()
+    _outbox.put((send_delete_bulletin_to_bbs_nodes, (bulletin_id, bbs_nodes, interface)))
 
 
 def add_mail(
@@ -255,30 +440,59 @@ def add_mail(
     Returns:
         str: The unique identifier of the mail.
     """
-    conn = get_db_connection()
-    c = conn.cursor()
-    date = datetime.now().strftime("%Y-%m-%d %H:%M")
     if not unique_id:
         unique_id = str(uuid.uuid4())
-    c.execute(
-        "INSERT INTO mail (sender, sender_short_name, recipient, date, subject, content, unique_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (sender_id, sender_short_name, recipient_id, date, subject, content, unique_id),
-    )
-    conn.commit()
+    with writer_conn() as conn:
+        conn.execute(
+            SQL_INSERT_MAIL_NOW,
+            (
+                sender_id,
+                sender_short_name,
+                recipient_id,
+                subject,
+                content,
+                unique_id,
+            ),
+        )
+        conn.commit()
     if bbs_nodes and interface:
-        send_mail_to_bbs_nodes(
-            sender_id,
-            sender_short_name,
-            recipient_id,
-            subject,
-            content,
-            unique_id,
-            bbs_nodes,
-            interface,
+        _outbox.put(
+            (
+                send_mail_to_bbs_nodes,
+                (
+                    sender_id,
+                    sender_short_name,
+                    recipient_id,
+                    subject,
+                    content,
+                    unique_id,
+                    bbs_nodes,
+                    interface,
+                ),
+            )
         )
     return unique_id
 
 
+def add_mails_bulk(rows):
+    """
+    Insert a batch of mail rows with one prepared statement and one commit.
+
+    Args:
+        rows (list of tuple): Tuples of (sender, sender_short_name,
+            recipient, date, subject, content, unique_id), matching the
+            mail schema.
+
+    Returns:
+        None
+    """
+    if not rows:
+        return
+    with writer_conn() as conn:
+        with conn:
+            conn.executemany(SQL_INSERT_MAIL, rows)
+
+
 def get_mail(recipient_id):
     """
     Retrieve mail for a specific recipient from the database.
@@ -295,18 +509,24 @@ def get_mail(recipient_id):
             - unique_id (str): The unique identifier of the mail.
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        "SELECT id, sender_short_name, subject, date, unique_id FROM mail WHERE recipient = ?",
-        (recipient_id,),
-    )
+    c = get_cursor()
+    c.execute(SQL_SELECT_MAIL, (recipient_id,))
     return c.fetchall()
 
 
+# Bounded cache of mail rows keyed by (mail_id, recipient_id). Mail is
+# mutable only through deletion, so delete_mail evicts the matching entry.
+_MAIL_CONTENT_CACHE: dict = {}
+_MAIL_CONTENT_CACHE_MAX = 256
+
+
 def get_mail_content(mail_id, recipient_id):
     """
     Retrieve the content of a mail for a specific recipient.
 
+    Rows are cached in a bounded FIFO dict so re-reading the same message
+    (e.g. after a mistyped number) doesn't re-hit the database.
+
     Args:
         mail_id (int): The ID of the mail to retrieve.
         recipient_id (int): The ID of the recipient.
@@ -315,16 +535,19 @@ def get_mail_content(mail_id, recipient_id):
         tuple: A tuple containing the sender's short name, date, subject, content, and unique ID of the mail if found, otherwise None.
     """
     # TODO: ensure only recipient can read mail
+    key = (mail_id, recipient_id)
+    cached = _MAIL_CONTENT_CACHE.get(key)
+    if cached is not None:
+        return cached
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute(
-        "SELECT sender_short_name, date, subject, content, unique_id FROM mail WHERE id = ? and recipient = ?",
-        (
-            mail_id,
-            recipient_id,
-        ),
-    )
-    return c.fetchone()
+    c = get_cursor()
+    c.execute(SQL_SELECT_MAIL_CONTENT, (mail_id, recipient_id))
+    row = c.fetchone()
+    if row is not None:
+        if len(_MAIL_CONTENT_CACHE) >= _MAIL_CONTENT_CACHE_MAX:
+            _MAIL_CONTENT_CACHE.pop(next(iter(_MAIL_CONTENT_CACHE)))
+        _MAIL_CONTENT_CACHE[key] = row
+    return row
 
 
 def delete_mail(unique_id, recipient_id, bbs_nodes, interface):
@@ -345,29 +568,21 @@ def delete_mail(unique_id, recipient_id, bbs_nodes, interface):
         Logs the attempt to delete the mail.
         Logs the successful deletion and synchronization message.
     """
-    conn = get_db_connection()
-    c = conn.cursor()
     try:
-        c.execute("SELECT recipient FROM mail WHERE unique_id = ?", (unique_id,))
-        result = c.fetchone()
+        # unique_id already identifies the row, so delete and read the
+        # recipient back in one statement instead of SELECT-then-DELETE.
+        with writer_conn() as conn:
+            result = conn.execute(SQL_DELETE_MAIL, (unique_id,)).fetchone()
+            conn.commit()
         if result is None:
             logging.error("No mail found with unique_id: %s", unique_id)
             return  # Early exit if no matching mail found
         recipient_id = result[0]
-        logging.info(
-            "Attempting to delete mail with unique_id: %s by %s",
-            unique_id,
-            recipient_id,
-        )
-        c.execute(
-            "DELETE FROM mail WHERE unique_id = ? and recipient = ?",
-            (
-                unique_id,
-                recipient_id,
-            ),
-        )
-        conn.commit()
-        send_delete_mail_to_bbs_nodes(unique_id, bbs_nodes, interface)
+        for key in [
+            k for k, v in _MAIL_CONTENT_CACHE.items() if v[4] == unique_id
+        ]:
+            del _MAIL_CONTENT_CACHE[key]
+        _outbox.put((send_delete_mail_to_bbs_nodes, (unique_id, bbs_nodes, interface)))
         logging.info(
             "Mail with unique_id: %s deleted and sync message sent.", unique_id
         )
@@ -387,8 +602,8 @@ def get_sender_id_by_mail_id(mail_id):
         int or None: The sender ID if found, otherwise None.
     """
     conn = get_db_connection()
-    c = conn.cursor()
-    c.execute("SELECT sender FROM mail WHERE id = ?", (mail_id,))
+    c = get_cursor()
+    c.execute(SQL_SELECT_MAIL_SENDER, (mail_id,))
     result = c.fetchone()
     if result:
         return result[0]
@@ -2,8 +2,13 @@
 JS8Call utilities.
 """
 
-from socket import socket, AF_INET, SOCK_STREAM
+from socket import socket, AF_INET, SOCK_STREAM, SOL_SOCKET, SO_RCVBUF, SO_SNDBUF
+import functools
+import itertools
 import json
+import os
+import queue
+import threading
 import time
 import sqlite3
 import configparser
@@ -16,6 +21,119 @@ from utils import send_message, update_user_state
 from config_init import CONFIG_FILE
 
 
+# Parsed configuration cached by file mtime, so repeated client
+# construction (e.g. reconnect loops) and the shared-connection setup
+# don't re-read and re-parse the INI file.
+_config_cache = None
+_config_mtime = None
+
+
+def _load_config():
+    """
+    Return the parsed configuration, re-reading it only when the file
+    changes on disk.
+
+    Returns:
+        configparser.ConfigParser: The cached parsed configuration.
+    """
+    global _config_cache, _config_mtime
+    try:
+        mtime = os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        mtime = None
+    if _config_cache is None or mtime != _config_mtime:
+        config = configparser.ConfigParser()
+        config.read(CONFIG_FILE)
+        _config_cache = config
+        _config_mtime = mtime
+    return _config_cache
+
+
+# Rendered listing pages cached by (table, page). Menu navigation often
+# revisits the same page with nothing written in between; the cache is
+# cleared whenever a flush lands new rows, so hits are pure string reuse.
+_listing_cache: dict = {}
+
+
+def _invalidate_listings():
+    """
+    Drop all cached listing pages; called after new rows are committed.
+    """
+    _listing_cache.clear()
+
+
+# Shared connection for the menu handlers, opened lazily on first use.
+# Reconnecting per keystroke paid connection setup and schema-cache
+# warmup each time, and hardcoded the database path instead of honouring
+# the configured db_file.
+_db_connection = None
+_db_cursor = None
+_db_lock = threading.Lock()
+
+
+def _get_db():
+    """
+    Return the shared js8call database connection, opening it on first use.
+
+    The connection is created with the configured db_file (falling back
+    to js8call.db), the standard PRAGMAs applied once, and
+    check_same_thread disabled so any handler thread may use it.
+
+    Returns:
+        sqlite3.Connection: The shared database connection.
+    """
+    global _db_connection, _db_cursor
+    with _db_lock:
+        if _db_connection is None:
+            db_file = _load_config().get("js8call", "db_file", fallback="js8call.db")
+            _db_connection = sqlite3.connect(db_file, check_same_thread=False)
+            _db_connection.executescript(DB_PRAGMAS)
+            _db_cursor = _db_connection.cursor()
+        return _db_connection
+
+
+def _get_cursor():
+    """
+    Return the shared cursor for the menu handlers, opening the
+    connection first if needed.
+
+    Reusing one cursor keeps the driver's statement cache warm and
+    avoids a cursor allocation per keystroke.
+
+    Returns:
+        sqlite3.Cursor: The shared cursor.
+    """
+    _get_db()
+    return _db_cursor
+
+
+# Closes the params object opened by the prefix from _encode_static once
+# the _ID digits have been spliced in between the two.
+_STATIC_SUFFIX = b'"}}\n'
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_static(typ, value=""):
+    """
+    Return the serialized wire prefix for a parameterless command.
+
+    Fixed control commands like STATION.GET_STATUS serialize identically
+    every time except for the per-send correlation _ID, so everything up
+    to the _ID digits is built and encoded once per (typ, value) pair.
+    The prefix ends inside the _ID string; appending the digits and
+    _STATIC_SUFFIX yields exactly what to_message would have produced.
+
+    Args:
+        typ (str): The type of the message.
+        value (str, optional): The value of the message. Defaults to an empty string.
+
+    Returns:
+        bytes: The encoded message up to the _ID value.
+    """
+    head = json.dumps({"type": typ, "value": value})
+    return (head[:-1] + ', "params": {"_ID": "').encode("utf-8")
+
+
 def from_message(content):
     """
     Parses a JSON-formatted string and returns the corresponding dictionary.
@@ -49,40 +167,113 @@ def to_message(typ, value="", params=None):
     return json.dumps({"type": typ, "value": value, "params": params})
 
 
+# Connection PRAGMAs applied to every js8call.db handle. WAL plus
+# synchronous=NORMAL drops the full fsync barrier on each commit, which
+# is the dominant cost of the write-heavy insert path.
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-20000;"
+)
+
+# Rows shown per listing page; keeps responses bounded (and cheap to
+# send over the radio link) no matter how large the tables grow.
+PAGE_SIZE = 20
+
+# Flush thresholds for the batched message writer: pending rows are
+# committed when either limit is reached, so a busy channel costs one
+# fsync per batch instead of one per message.
+FLUSH_MAX_PENDING = 500
+FLUSH_INTERVAL = 1.0
+
+
 class JS8CallClient:
     """
     JS8CallClient class
     """
 
+    # Frame types worth inspecting, as a frozenset for O(1) membership
+    # instead of a list rebuilt and scanned per inbound frame.
+    _RX_TYPES = frozenset(
+        {
+            "RX.ACTIVITY",
+            "RX.DIRECTED",
+            "RX.SPOT",
+            "RX.CALL_ACTIVITY",
+            "RX.CALL_SELECTED",
+            "RX.DIRECTED_ME",
+            "RX.ECHO",
+            "RX.DIRECTED_GROUP",
+            "RX.META",
+            "RX.MSG",
+            "RX.PING",
+            "RX.PONG",
+            "RX.STREAM",
+        }
+    )
+
+    # Fixed SQL text per table: byte-identical statements let sqlite3's
+    # prepared-statement cache hit on every flush instead of re-parsing
+    # a freshly formatted string.
+    _INSERT_SQL = {
+        "messages": "INSERT INTO messages (sender, receiver, message) VALUES (?, ?, ?)",
+        "groups": "INSERT INTO groups (sender, groupname, message) VALUES (?, ?, ?)",
+        "urgent": "INSERT INTO urgent (sender, groupname, message) VALUES (?, ?, ?)",
+    }
+
     def __init__(self, interface, logger=None):
         self.logger = logger or logging.getLogger("js8call")
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False
 
-        self.config = configparser.ConfigParser()
-        self.config.read(CONFIG_FILE)
+        self.config = _load_config()
 
         self.server = (
             self.config.get("js8call", "host", fallback=None),
             self.config.getint("js8call", "port", fallback=None),
         )
         self.db_file = self.config.get("js8call", "db_file", fallback=None)
-        self.js8groups = self.config.get("js8call", "js8groups", fallback="").split(",")
         self.store_messages = self.config.getboolean(
             "js8call", "store_messages", fallback=True
         )
-        self.js8urgent = self.config.get("js8call", "js8urgent", fallback="").split(",")
-        self.js8groups = [group.strip() for group in self.js8groups]
-        self.js8urgent = [group.strip() for group in self.js8urgent]
+        # Frozensets: the receiver membership tests in process run per
+        # inbound frame.
+        self.js8groups = frozenset(
+            group.strip()
+            for group in self.config.get("js8call", "js8groups", fallback="").split(",")
+        )
+        self.js8urgent = frozenset(
+            group.strip()
+            for group in self.config.get("js8call", "js8urgent", fallback="").split(",")
+        )
 
         self.connected = False
         self.sock = None
         self.db_conn = None
         self.interface = interface
 
+        # Received messages travel through a bounded queue to a
+        # dedicated writer thread, which buffers them per table until
+        # the next flush. The receive loop never waits on the disk.
+        # Monotonic _ID source seeded from the wall clock: unique even
+        # for sends landing in the same millisecond, and no per-send
+        # float math or time syscall.
+        self._id_counter = itertools.count(int(time.time() * 1000))
+        self._write_q: queue.Queue = queue.Queue(maxsize=10000)
+        self._pending = {"messages": [], "groups": [], "urgent": []}
+        self._pending_count = 0
+        self._writer = None
+
         if self.db_file:
-            self.db_conn = sqlite3.connect(self.db_file)
+            # The connection is created here but used (after
+            # create_tables) only by the writer thread.
+            self.db_conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self.db_conn.executescript(DB_PRAGMAS)
             self.create_tables()
+            self._write_cur = self.db_conn.cursor()
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
         else:
             self.logger.info(
                 "JS8Call configuration not found. Skipping JS8Call integration."
@@ -138,6 +329,15 @@ class JS8CallClient:
                 )
             """
             )
+            # groupname indexes: the per-group listing and the DISTINCT
+            # groupname menu query both become index scans instead of
+            # full table scans as history grows.
+            self.db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_groups_groupname ON groups(groupname)"
+            )
+            self.db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_urgent_groupname ON urgent(groupname)"
+            )
         self.logger.info("Database tables created or verified.")
 
     def insert_message(self, table, sender, recipient, message):
@@ -172,17 +372,74 @@ class JS8CallClient:
             self.logger.error("Database connection is not available.")
             return
 
+        try:
+            self._write_q.put_nowait((table, sender, recipient, message))
+        except queue.Full:
+            self.logger.error("Write queue full; dropping %s message.", table)
+
+    def _writer_loop(self):
+        """
+        Drain the write queue on a dedicated thread, flushing in batches.
+
+        Each batch collects up to FLUSH_MAX_PENDING rows or whatever
+        arrives within FLUSH_INTERVAL of the first row, then flushes in
+        one transaction. A None sentinel from close() flushes the
+        remainder and ends the thread.
+        """
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                self.flush()
+                return
+            self._buffer(item)
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while self._pending_count < FLUSH_MAX_PENDING:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.flush()
+                    return
+                self._buffer(item)
+            self.flush()
+
+    def _buffer(self, item):
+        """
+        Add one queued (table, sender, recipient, message) row to the
+        pending buffers.
+        """
+        table, sender, recipient, message = item
+        self._pending[table].append((sender, recipient, message))
+        self._pending_count += 1
+
+    def flush(self):
+        """
+        Write all buffered messages to the database in one transaction.
+
+        Each pending table is drained with a single executemany, so a
+        flush costs one prepared statement per table and one commit in
+        total, however many messages accumulated since the last flush.
+        Only the writer thread calls this.
+        """
+        if not self.db_conn or not self._pending_count:
+            return
+
         try:
             with self.db_conn:
-                self.db_conn.execute(
-                    f"""
-                    INSERT INTO {table} (sender, { "receiver" if table == "messages" else "groupname" }, message)
-                    VALUES (?, ?, ?)
-                """,
-                    (sender, recipient, message),
-                )
+                for table, rows in self._pending.items():
+                    if rows:
+                        self._write_cur.executemany(self._INSERT_SQL[table], rows)
         except sqlite3.Error as e:
-            self.logger.error("Failed to insert message into %s table: %s", table, e)
+            self.logger.error("Failed to flush pending messages: %s", e)
+        else:
+            _invalidate_listings()
+        for rows in self._pending.values():
+            rows.clear()
+        self._pending_count = 0
 
     def process(self, message):
         """
@@ -207,40 +464,21 @@ class JS8CallClient:
         # pylint: disable = unused-variable
         params = message.get("params", {})
 
-        if not typ:
-            return
-
-        rx_types = [
-            "RX.ACTIVITY",
-            "RX.DIRECTED",
-            "RX.SPOT",
-            "RX.CALL_ACTIVITY",
-            "RX.CALL_SELECTED",
-            "RX.DIRECTED_ME",
-            "RX.ECHO",
-            "RX.DIRECTED_GROUP",
-            "RX.META",
-            "RX.MSG",
-            "RX.PING",
-            "RX.PONG",
-            "RX.STREAM",
-        ]
-
-        if typ not in rx_types:
+        if not typ or typ not in self._RX_TYPES:
             return
 
         if typ == "RX.DIRECTED" and value:
-            parts = value.split(" ")
+            parts = value.split(" ", 2)
             if len(parts) < 3:
-                self.logger.warning(f"Unexpected message format: {value}")
+                self.logger.warning("Unexpected message format: %s", value)
                 return
 
             sender = parts[0]
             receiver = parts[1]
-            msg = " ".join(parts[2:]).strip()
+            msg = parts[2].strip()
 
             self.logger.info(
-                f"Received JS8Call message: {sender} to {receiver} - {msg}"
+                "Received JS8Call message: %s to %s - %s", sender, receiver, msg
             )
 
             if receiver in self.js8urgent:
@@ -269,15 +507,23 @@ class JS8CallClient:
         Returns:
             None
         """
-        params = kwargs.get("params", {})
-        if "_ID" not in params:
-            # pylint: disable = consider-using-f-string
-            params["_ID"] = "{}".format(
-                int(time.time() * 1000)
+        params = kwargs.get("params")
+        if not params:
+            # Parameterless control commands reuse their cached prefix;
+            # only the correlation _ID differs per send, so its digits are
+            # spliced in between prefix and suffix.
+            value = args[1] if len(args) > 1 else kwargs.get("value", "")
+            self.sock.sendall(
+                _encode_static(args[0], value)
+                + str(next(self._id_counter)).encode("ascii")
+                + _STATIC_SUFFIX
             )
+            return
+        if "_ID" not in params:
+            params["_ID"] = str(next(self._id_counter))
             kwargs["params"] = params
         message = to_message(*args, **kwargs)
-        self.sock.send((message + "\n").encode("utf-8"))  # Convert to bytes
+        self.sock.sendall((message + "\n").encode("utf-8"))  # Convert to bytes
 
     def connect(self):
         """
@@ -308,35 +554,62 @@ class JS8CallClient:
         self.sock = socket(AF_INET, SOCK_STREAM)
         try:
             self.sock.connect(self.server)
+            # Large kernel buffers: the receive side rides out flush
+            # stalls without dropping frames, and the send side absorbs
+            # back-to-back commands without blocking the caller.
+            self.sock.setsockopt(SOL_SOCKET, SO_RCVBUF, 1 << 20)
+            self.sock.setsockopt(SOL_SOCKET, SO_SNDBUF, 1 << 20)
             self.connected = True
             self.send("STATION.GET_STATUS")
 
+            # A short receive timeout keeps the loop responsive to
+            # close() even when the channel is quiet.
+            self.sock.settimeout(FLUSH_INTERVAL)
+            # The JS8Call protocol is newline-delimited, but a single
+            # read can return a partial frame or several frames
+            # concatenated. recv_into fills one preallocated buffer (no
+            # fresh bytes object per read) and complete lines are peeled
+            # off a reusable tail, so no frame is silently dropped.
+            recv_buf = bytearray(65536)
+            recv_view = memoryview(recv_buf)
+            tail = bytearray()
             while self.connected:
-                content = self.sock.recv(65500).decode(
-                    "utf-8"
-                )  # Decode received bytes to string
-                if not content:
-                    continue  # Skip empty content
-
                 try:
-                    message = json.loads(content)
-                except ValueError:
-                    continue  # Skip invalid JSON content
-
-                if not message:
-                    continue  # Skip empty message
-
-                self.process(message)
+                    n = self.sock.recv_into(recv_view)
+                except TimeoutError:
+                    continue
+                if not n:
+                    break  # Server closed the connection
+
+                tail += recv_view[:n]
+                start = 0
+                while True:
+                    end = tail.find(b"\n", start)
+                    if end < 0:
+                        break
+                    line = bytes(tail[start:end])
+                    start = end + 1
+                    if line:
+                        message = from_message(line)
+                        if message:
+                            self.process(message)
+                if start:
+                    del tail[:start]
         except ConnectionRefusedError:
-            self.logger.error(f"Connection to JS8Call server {self.server} refused.")
+            self.logger.error("Connection to JS8Call server %s refused.", self.server)
         finally:
             self.sock.close()
 
     def close(self):
         """
-        Closes the connection by setting the connected attribute to False.
+        Closes the connection by setting the connected attribute to False
+        and waiting for the writer thread to flush any buffered messages.
         """
         self.connected = False
+        if self._writer is not None:
+            self._write_q.put(None)
+            self._writer.join(timeout=5)
+            self._writer = None
 
 
 def handle_js8call_command(sender_id, interface):
@@ -377,15 +650,14 @@ def handle_js8call_steps(sender_id, message, step, interface, state):
 
     if step == 1:
         choice = message
-        if choice == "x":
-            handle_help_command(sender_id, interface, "bbs")
+        if choice in ("n", "p") and state.get("list"):
+            table, title = state["list"]
+            page = state["page"] + 1 if choice == "n" else max(state["page"] - 1, 0)
+            _send_message_page(sender_id, interface, table, title, page)
             return
-        elif choice == "g":
-            handle_group_messages_command(sender_id, interface)
-        elif choice == "s":
-            handle_station_messages_command(sender_id, interface)
-        elif choice == "u":
-            handle_urgent_messages_command(sender_id, interface)
+        handler = _JS8_MENU_HANDLERS.get(choice)
+        if handler:
+            handler(sender_id, interface)
         else:
             send_message("Invalid option. Please choose again.", sender_id, interface)
             handle_js8call_command(sender_id, interface)
@@ -406,15 +678,15 @@ def handle_group_messages_command(sender_id, interface):
     Returns:
         None
     """
-    conn = sqlite3.connect("js8call.db")
-    c = conn.cursor()
+    c = _get_cursor()
     c.execute("SELECT DISTINCT groupname FROM groups")
     groups = c.fetchall()
     if groups:
-        response = "Group Messages Menu:\n" + "\n".join(
-            [f"[{i}] {group[0]}" for i, group in enumerate(groups)]
-        )
-        send_message(response, sender_id, interface)
+        # Single-pass build and one join: no intermediate list plus
+        # header concat per render.
+        lines = ["Group Messages Menu:"]
+        lines.extend(f"[{i}] {group[0]}" for i, group in enumerate(groups))
+        send_message("\n".join(lines), sender_id, interface)
         update_user_state(
             sender_id, {"command": "GROUP_MESSAGES", "step": 1, "groups": groups}
         )
@@ -423,70 +695,132 @@ def handle_group_messages_command(sender_id, interface):
         handle_js8call_command(sender_id, interface)
 
 
-def handle_station_messages_command(sender_id, interface):
+def _send_message_page(sender_id, interface, table, title, page):
+    """
+    Send one bounded page of a message table, newest first.
+
+    Fetches PAGE_SIZE rows plus one sentinel row to learn whether a next
+    page exists, so listings stay a constant size however large the
+    table grows. The user state keeps the table and page so [N]ext and
+    [P]rev in the JS8Call menu can move through history.
+
+    Args:
+        sender_id (str): The ID of the sender to whom the page is sent.
+        interface (object): The interface object used to send messages.
+        table (str): The table to list: 'messages' or 'urgent'.
+        title (str): The heading for the listing.
+        page (int): The zero-based page number to show.
+
+    Returns:
+        None
+    """
+    response = _listing_cache.get((table, page))
+    if response is not None:
+        send_message(response, sender_id, interface)
+        update_user_state(
+            sender_id,
+            {
+                "command": "JS8CALL_MENU",
+                "step": 1,
+                "list": (table, title),
+                "page": page,
+            },
+        )
+        return
+
+    column = "receiver" if table == "messages" else "groupname"
+    c = _get_cursor()
+    c.execute(
+        f"SELECT sender, {column}, message, timestamp FROM {table} "
+        "ORDER BY id DESC LIMIT ? OFFSET ?",
+        (PAGE_SIZE + 1, page * PAGE_SIZE),
+    )
+    # fetchmany keeps exactly one page in memory; the sentinel row, if
+    # any, is read separately rather than sliced off a larger list.
+    rows = c.fetchmany(PAGE_SIZE)
+    if not rows:
+        if page > 0:
+            send_message("No more messages.", sender_id, interface)
+        else:
+            send_message(f"No {title.lower()} available.", sender_id, interface)
+        handle_js8call_command(sender_id, interface)
+        return
+
+    has_next = c.fetchone() is not None
+    offset = page * PAGE_SIZE
+    lines = [f"{title} (page {page + 1}):"]
+    lines.extend(
+        f"[{offset + i + 1}] {msg[0]} -> {msg[1]}: {msg[2]} ({msg[3]})"
+        for i, msg in enumerate(rows)
+    )
+    nav = []
+    if has_next:
+        nav.append("[N]ext")
+    if page > 0:
+        nav.append("[P]rev")
+    nav.append("E[X]IT")
+    lines.append(" ".join(nav))
+    response = "\n".join(lines)
+    _listing_cache[(table, page)] = response
+    send_message(response, sender_id, interface)
+    update_user_state(
+        sender_id,
+        {
+            "command": "JS8CALL_MENU",
+            "step": 1,
+            "list": (table, title),
+            "page": page,
+        },
+    )
+
+
+def handle_station_messages_command(sender_id, interface, page=0):
     """
     Handles the command to retrieve and send station messages.
 
-    This function connects to the 'js8call.db' SQLite database, retrieves all messages
-    from the 'messages' table, and sends them to the specified sender via the given interface.
-    If no messages are found, it sends a message indicating that no station messages are available.
-    After processing the messages, it calls the handle_js8call_command function.
+    Sends one page of the 'messages' table, newest first, to the
+    specified sender. If no messages are found, it sends a message
+    indicating that no station messages are available and re-displays
+    the JS8Call menu.
 
     Args:
         sender_id (str): The ID of the sender to whom the messages will be sent.
         interface (object): The interface object used to send messages.
+        page (int, optional): The zero-based page to show. Defaults to 0.
 
     Returns:
         None
     """
-    conn = sqlite3.connect("js8call.db")
-    c = conn.cursor()
-    c.execute("SELECT sender, receiver, message, timestamp FROM messages")
-    messages = c.fetchall()
-    if messages:
-        response = "Station Messages:\n" + "\n".join(
-            [
-                f"[{i+1}] {msg[0]} -> {msg[1]}: {msg[2]} ({msg[3]})"
-                for i, msg in enumerate(messages)
-            ]
-        )
-        send_message(response, sender_id, interface)
-    else:
-        send_message("No station messages available.", sender_id, interface)
-    handle_js8call_command(sender_id, interface)
+    _send_message_page(sender_id, interface, "messages", "Station Messages", page)
 
 
-def handle_urgent_messages_command(sender_id, interface):
+def handle_urgent_messages_command(sender_id, interface, page=0):
     """
     Handles the command to retrieve and send urgent messages.
 
-    This function connects to the 'js8call.db' SQLite database, retrieves all
-    urgent messages from the 'urgent' table, and sends them to the specified
-    sender via the given interface. If no urgent messages are available, it
-    sends a message indicating that.
+    Sends one page of the 'urgent' table, newest first, to the specified
+    sender. If no urgent messages are available, it sends a message
+    indicating that and re-displays the JS8Call menu.
 
     Args:
         sender_id (str): The ID of the sender requesting the urgent messages.
         interface (object): The interface used to send the messages.
+        page (int, optional): The zero-based page to show. Defaults to 0.
 
     Returns:
         None
     """
-    conn = sqlite3.connect("js8call.db")
-    c = conn.cursor()
-    c.execute("SELECT sender, groupname, message, timestamp FROM urgent")
-    messages = c.fetchall()
-    if messages:
-        response = "Urgent Messages:\n" + "\n".join(
-            [
-                f"[{i+1}] {msg[0]} -> {msg[1]}: {msg[2]} ({msg[3]})"
-                for i, msg in enumerate(messages)
-            ]
-        )
-        send_message(response, sender_id, interface)
-    else:
-        send_message("No urgent messages available.", sender_id, interface)
-    handle_js8call_command(sender_id, interface)
+    _send_message_page(sender_id, interface, "urgent", "Urgent Messages", page)
+
+# Menu dispatch table: one dict lookup per keystroke instead of an
+# if/elif chain, and trivial to extend with new options.
+_JS8_MENU_HANDLERS = {
+    "x": lambda sender_id, interface: handle_help_command(sender_id, interface, "bbs"),
+    "g": handle_group_messages_command,
+    "s": handle_station_messages_command,
+    "u": handle_urgent_messages_command,
+}
+
 
 # pylint: disable = unused-argument
 def handle_group_message_selection(sender_id, message, step, state, interface):
@@ -513,22 +847,21 @@ def handle_group_message_selection(sender_id, message, step, state, interface):
         group_index = int(message)
         groupname = groups[group_index][0]
 
-        conn = sqlite3.connect("js8call.db")
-        c = conn.cursor()
+        c = _get_cursor()
         c.execute(
-            "SELECT sender, message, timestamp FROM groups WHERE groupname=?",
-            (groupname,),
+            "SELECT sender, message, timestamp FROM groups WHERE groupname=? "
+            "ORDER BY id DESC LIMIT ?",
+            (groupname, PAGE_SIZE),
         )
-        messages = c.fetchall()
-
-        if messages:
-            response = f"Messages for group {groupname}:\n" + "\n".join(
-                [
-                    f"[{i+1}] {msg[0]}: {msg[1]} ({msg[2]})"
-                    for i, msg in enumerate(messages)
-                ]
-            )
-            send_message(response, sender_id, interface)
+
+        # Stream rows straight off the cursor into the line list; the
+        # full result set is never materialized separately.
+        lines = [f"Messages for group {groupname}:"]
+        lines.extend(
+            f"[{i+1}] {msg[0]}: {msg[1]} ({msg[2]})" for i, msg in enumerate(c)
+        )
+        if len(lines) > 1:
+            send_message("\n".join(lines), sender_id, interface)
         else:
             send_message(f"No messages for group {groupname}.", sender_id, interface)
     except (IndexError, ValueError):
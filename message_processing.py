@@ -2,6 +2,8 @@
 Message processing utilities.
 """
 import logging
+import threading
+import time
 
 from meshtastic import BROADCAST_NUM  # type: ignore
 
@@ -28,10 +30,11 @@ from command_handlers import (
     handle_post_channel_command,
     handle_list_channels_command,
     handle_quick_help_command,
+    resolve_sender,
 )
 from db_operations import (
-    add_bulletin,
-    add_mail,
+    add_bulletins_bulk,
+    add_mails_bulk,
     delete_bulletin,
     delete_mail,
     get_db_connection,
@@ -43,10 +46,10 @@ from js8call_integration import (
     handle_group_message_selection,
 )
 from utils import (
-    get_user_state,
     get_node_short_name,
     get_node_id_from_num,
     send_message,
+    user_state_transition,
 )
 
 main_menu_handlers = {
@@ -75,23 +78,57 @@ utilities_menu_handlers = {
 }
 
 
+def _board_menu_handler(board_number, board_state):
+    """
+    Build a menu handler that enters board selection with a prebuilt state.
+
+    The state dict is created once here instead of on every menu press;
+    the board-selection step only reads it, so sharing is safe.
+
+    Args:
+        board_number (str): The board index passed as the selection message.
+        board_state (dict): The constant state dict for the board.
+
+    Returns:
+        callable: A (sender_id, interface) handler for the menu table.
+    """
+
+    def handler(sender_id, interface):
+        handle_bb_steps(sender_id, board_number, 1, board_state, interface, None)
+
+    return handler
+
+
 bulletin_menu_handlers = {
-    "g": lambda sender_id, interface: handle_bb_steps(
-        sender_id, "0", 1, {"board": "General"}, interface, None
-    ),
-    "i": lambda sender_id, interface: handle_bb_steps(
-        sender_id, "1", 1, {"board": "Info"}, interface, None
-    ),
-    "n": lambda sender_id, interface: handle_bb_steps(
-        sender_id, "2", 1, {"board": "News"}, interface, None
-    ),
-    "u": lambda sender_id, interface: handle_bb_steps(
-        sender_id, "3", 1, {"board": "Urgent"}, interface, None
-    ),
+    "g": _board_menu_handler("0", {"board": "General"}),
+    "i": _board_menu_handler("1", {"board": "Info"}),
+    "n": _board_menu_handler("2", {"board": "News"}),
+    "u": _board_menu_handler("3", {"board": "Urgent"}),
     "x": handle_help_command,
 }
 
 
+def _normalize_cmd(message):
+    """
+    Strips a command message and collapses the repeated-character suffix.
+
+    Single-character commands may be padded with trailing 'x' characters
+    (e.g. 'dx' or 'dxx' for 'd') to defeat client-side dedup; collapse
+    any all-'x' tail once here so the step handlers don't each
+    re-normalize and longer repeats aren't mistaken for unknown commands.
+
+    Args:
+        message (str): The raw message text.
+
+    Returns:
+        str: The normalized message.
+    """
+    message = message.strip()
+    if len(message) > 1 and all(c in "xX" for c in message[1:]):
+        message = message[0]
+    return message
+
+
 board_action_handlers = {
     "r": lambda sender_id, interface, state: handle_bb_steps(
         sender_id, "r", 2, state, interface, None
@@ -103,6 +140,228 @@ board_action_handlers = {
 }
 
 
+# Incoming sync rows are coalesced into one transaction per burst: up to
+# SYNC_BATCH_MAX rows, or whatever arrives within SYNC_BATCH_WINDOW of
+# the first buffered row, land with a single commit via the bulk insert
+# helpers instead of one fsync per message.
+SYNC_BATCH_MAX = 50
+SYNC_BATCH_WINDOW = 0.05
+
+_sync_batch_lock = threading.Lock()
+_pending_sync_bulletins: list = []
+_pending_sync_mail: list = []
+_sync_flush_timer = None
+
+
+def _flush_sync_batch():
+    """
+    Commit all buffered sync rows in one transaction per table.
+    """
+    global _sync_flush_timer
+    with _sync_batch_lock:
+        bulletins = _pending_sync_bulletins[:]
+        _pending_sync_bulletins.clear()
+        mail = _pending_sync_mail[:]
+        _pending_sync_mail.clear()
+        if _sync_flush_timer is not None:
+            _sync_flush_timer.cancel()
+            _sync_flush_timer = None
+    add_bulletins_bulk(bulletins)
+    add_mails_bulk(mail)
+
+
+def _queue_sync_row(rows, row):
+    """
+    Buffer one sync row, flushing when the batch fills and arming the
+    window timer when the batch opens.
+
+    Args:
+        rows (list): The pending-row list to append to.
+        row (tuple): The row matching the target table's bulk schema.
+    """
+    global _sync_flush_timer
+    flush_now = False
+    with _sync_batch_lock:
+        rows.append(row)
+        if len(_pending_sync_bulletins) + len(_pending_sync_mail) >= SYNC_BATCH_MAX:
+            flush_now = True
+        elif _sync_flush_timer is None:
+            _sync_flush_timer = threading.Timer(SYNC_BATCH_WINDOW, _flush_sync_batch)
+            _sync_flush_timer.daemon = True
+            _sync_flush_timer.start()
+    if flush_now:
+        _flush_sync_batch()
+
+
+def _sync_bulletin(payload, interface):
+    """
+    Apply a BULLETIN sync payload: batch it for storage and notify if urgent.
+    """
+    board, sender_short_name, subject, content, unique_id = payload.split("|", 4)
+    _queue_sync_row(
+        _pending_sync_bulletins,
+        (
+            board,
+            sender_short_name,
+            time.strftime("%Y-%m-%d %H:%M"),
+            subject,
+            content,
+            unique_id,
+        ),
+    )
+    if board.lower() == "urgent":
+        notification_message = (
+            f"💥NEW URGENT BULLETIN💥\nFrom: {sender_short_name}\nTitle: {subject}"
+        )
+        send_message(notification_message, BROADCAST_NUM, interface)
+
+
+def _sync_mail(payload, interface):
+    """
+    Apply a MAIL sync payload by batching the mail for storage.
+    """
+    sender_id, sender_short_name, recipient_id, subject, content, unique_id = (
+        payload.split("|", 5)
+    )
+    _queue_sync_row(
+        _pending_sync_mail,
+        (
+            sender_id,
+            sender_short_name,
+            recipient_id,
+            time.strftime("%Y-%m-%d %H:%M"),
+            subject,
+            content,
+            unique_id,
+        ),
+    )
+
+
+def _sync_delete_bulletin(payload, interface):
+    """
+    Apply a DELETE_BULLETIN sync payload, landing any batched rows first.
+    """
+    _flush_sync_batch()
+    delete_bulletin(payload, [], interface)
+
+
+def _sync_delete_mail(payload, interface):
+    """
+    Apply a DELETE_MAIL sync payload, landing any batched rows first.
+    """
+    _flush_sync_batch()
+    logging.info("Processing delete mail with unique_id: %s", payload)
+    recipient_id = get_recipient_id_by_mail(payload)
+    delete_mail(payload, recipient_id, [], interface)
+
+
+def _sync_channel(payload, interface):
+    """
+    Apply a CHANNEL sync payload by storing the channel locally.
+    """
+    channel_name, channel_url = payload.split("|", 1)
+    add_channel(channel_name, channel_url)
+
+
+# Prefixes that mark a message as BBS-to-BBS sync traffic; startswith
+# accepts the tuple directly and scans it in C.
+SYNC_PREFIXES = ("BULLETIN|", "MAIL|", "DELETE_BULLETIN|", "DELETE_MAIL|")
+
+# Sync message tags mapped to their handlers. One partition plus a dict
+# lookup replaces the startswith chain, and each handler splits its
+# payload with a fixed maxsplit instead of re-splitting the whole
+# message into an unbounded list.
+sync_message_handlers = {
+    "BULLETIN": _sync_bulletin,
+    "MAIL": _sync_mail,
+    "DELETE_BULLETIN": _sync_delete_bulletin,
+    "DELETE_MAIL": _sync_delete_mail,
+    "CHANNEL": _sync_channel,
+}
+
+
+def _check_mail_steps(sender, sender_id, message, step, state, interface, bbs_nodes):
+    """
+    Route the CHECK_MAIL state to the read or delete-confirmation step.
+    """
+    if step == 1:
+        handle_read_mail_command(sender, message, state, interface)
+    elif step == 2:
+        handle_delete_mail_confirmation(sender, message, state, interface, bbs_nodes)
+
+
+# Quick-command prefixes mapped to their handlers; one pass over this
+# table replaces the startswith if/elif chain. All entries share the
+# (sender, sender_id, message, interface, bbs_nodes) shape.
+quick_command_handlers = {
+    "sm,,": lambda sender, sender_id, msg, i, n: handle_send_mail_command(
+        sender, msg, i, n
+    ),
+    "cm": lambda sender, sender_id, msg, i, n: handle_check_mail_command(sender, i),
+    "pb,,": lambda sender, sender_id, msg, i, n: handle_post_bulletin_command(
+        sender, msg, i, n
+    ),
+    "cb,,": lambda sender, sender_id, msg, i, n: handle_check_bulletin_command(
+        sender_id, msg, i
+    ),
+    "chp,,": lambda sender, sender_id, msg, i, n: handle_post_channel_command(
+        sender_id, msg, i
+    ),
+    "chl": lambda sender, sender_id, msg, i, n: handle_list_channels_command(
+        sender_id, i
+    ),
+}
+
+# Conversation states mapped to their step handlers: one dict lookup per
+# packet instead of a long elif chain. All entries share the
+# (sender, sender_id, message, step, state, interface, bbs_nodes) shape.
+state_command_handlers = {
+    "MAIL": lambda sender, sid, msg, step, state, i, n: handle_mail_steps(
+        sid, msg, step, state, i, n
+    ),
+    "BULLETIN": lambda sender, sid, msg, step, state, i, n: handle_bb_steps(
+        sid, msg, step, state, i, n
+    ),
+    "STATS": lambda sender, sid, msg, step, state, i, n: handle_stats_steps(
+        sid, msg, step, i
+    ),
+    "CHANNEL_DIRECTORY": lambda sender, sid, msg, step, state, i, n: (
+        handle_channel_directory_steps(sid, msg, step, state, i)
+    ),
+    "CHECK_MAIL": _check_mail_steps,
+    "CHECK_BULLETIN": lambda sender, sid, msg, step, state, i, n: (
+        handle_read_bulletin_command(sid, msg, state, i) if step == 1 else None
+    ),
+    "CHECK_CHANNEL": lambda sender, sid, msg, step, state, i, n: (
+        handle_read_channel_command(sid, msg, state, i) if step == 1 else None
+    ),
+    "LIST_CHANNELS": lambda sender, sid, msg, step, state, i, n: (
+        handle_read_channel_command(sid, msg, state, i) if step == 1 else None
+    ),
+    "BULLETIN_POST": lambda sender, sid, msg, step, state, i, n: handle_bb_steps(
+        sid, msg, 4, state, i, n
+    ),
+    "BULLETIN_POST_CONTENT": lambda sender, sid, msg, step, state, i, n: (
+        handle_bb_steps(sid, msg, 5, state, i, n)
+    ),
+    "BULLETIN_READ": lambda sender, sid, msg, step, state, i, n: handle_bb_steps(
+        sid, msg, 3, state, i, n
+    ),
+    "JS8CALL_MENU": lambda sender, sid, msg, step, state, i, n: handle_js8call_steps(
+        sid, msg, step, i, state
+    ),
+    "GROUP_MESSAGES": lambda sender, sid, msg, step, state, i, n: (
+        handle_group_message_selection(sid, msg, step, state, i)
+    ),
+}
+
+# Menu names mapped to their handler tables for the MENU state.
+menu_tables = {
+    "bbs": bbs_menu_handlers,
+    "utilities": utilities_menu_handlers,
+}
+
+
 def process_message(sender_id, message, interface, is_sync_message=False):
     """
     Processes incoming messages and performs actions based on the message content and user state.
@@ -116,107 +375,53 @@ def process_message(sender_id, message, interface, is_sync_message=False):
     Returns:
         None
     """
-    state = get_user_state(sender_id)
-    message_lower = message.lower().strip()
-    message_strip = message.strip()
-
-    bbs_nodes = interface.bbs_nodes
-
-    # Handle repeated characters for single character commands using a prefix
-    if len(message_lower) == 2 and message_lower[1] == "x":
-        message_lower = message_lower[0]
-
-    if is_sync_message:
-        if message.startswith("BULLETIN|"):
-            parts = message.split("|")
-            board, sender_short_name, subject, content, unique_id = (
-                parts[1],
-                parts[2],
-                parts[3],
-                parts[4],
-                parts[5],
-            )
-            add_bulletin(
-                board,
-                sender_short_name,
-                subject,
-                content,
-                [],
-                interface,
-                unique_id=unique_id,
-            )
-
-            if board.lower() == "urgent":
-                notification_message = f"💥NEW URGENT BULLETIN💥\nFrom: {sender_short_name}\nTitle: {subject}"
-                send_message(notification_message, BROADCAST_NUM, interface)
-        elif message.startswith("MAIL|"):
-            parts = message.split("|")
-            sender_id, sender_short_name, recipient_id, subject, content, unique_id = (
-                parts[1],
-                parts[2],
-                parts[3],
-                parts[4],
-                parts[5],
-                parts[6],
-            )
-            add_mail(
-                sender_id,
-                sender_short_name,
-                recipient_id,
-                subject,
-                content,
-                [],
-                interface,
-                unique_id=unique_id,
-            )
-        elif message.startswith("DELETE_BULLETIN|"):
-            unique_id = message.split("|")[1]
-            delete_bulletin(unique_id, [], interface)
-        elif message.startswith("DELETE_MAIL|"):
-            unique_id = message.split("|")[1]
-            logging.info("Processing delete mail with unique_id: %s", unique_id)
-            recipient_id = get_recipient_id_by_mail(unique_id)
-            delete_mail(unique_id, recipient_id, [], interface)
-        elif message.startswith("CHANNEL|"):
-            parts = message.split("|")
-            channel_name, channel_url = parts[1], parts[2]
-            add_channel(channel_name, channel_url)
-    else:
-        if message_lower.startswith("sm,,"):
-            handle_send_mail_command(sender_id, message_strip, interface, bbs_nodes)
-        elif message_lower.startswith("cm"):
-            handle_check_mail_command(sender_id, interface)
-        elif message_lower.startswith("pb,,"):
-            handle_post_bulletin_command(sender_id, message_strip, interface, bbs_nodes)
-        elif message_lower.startswith("cb,,"):
-            handle_check_bulletin_command(sender_id, message_strip, interface)
-        elif message_lower.startswith("chp,,"):
-            handle_post_channel_command(sender_id, message_strip, interface)
-        elif message_lower.startswith("chl"):
-            handle_list_channels_command(sender_id, interface)
+    # Hold the state lock across dispatch so the state read here and
+    # any update the handler makes are one atomic transition.
+    with user_state_transition(sender_id) as state:
+        command = state["command"] if state else None
+        # Content-accumulation states must see the text as typed: collapsing
+        # an all-'x' tail here would corrupt a subject or body line that
+        # simply ends in x. Everything else is command input and gets the
+        # strip and dedup-suffix collapse.
+        if command in ("BULLETIN_POST", "BULLETIN_POST_CONTENT"):
+            message_lower = message.lower().strip()
+        elif command == "MAIL" and state["step"] == 7:
+            message = message.strip()
+            message_lower = message.lower()
         else:
-            if state and state["command"] == "MENU":
-                menu_name = state["menu"]
-                if menu_name == "bbs":
-                    handlers = bbs_menu_handlers
-                elif menu_name == "utilities":
-                    handlers = utilities_menu_handlers
-                else:
-                    handlers = main_menu_handlers
-            elif state and state["command"] == "BULLETIN_MENU":
-                handlers = bulletin_menu_handlers
-            elif state and state["command"] == "BULLETIN_ACTION":
-                handlers = board_action_handlers
-            elif state and state["command"] == "JS8CALL_MENU":
-                handle_js8call_steps(
-                    sender_id, message, state["step"], interface, state
-                )
-                return
-            elif state and state["command"] == "GROUP_MESSAGES":
-                handle_group_message_selection(
-                    sender_id, message, state["step"], state, interface
+            message = _normalize_cmd(message)
+            message_lower = message.lower()
+        message_strip = message
+
+        bbs_nodes = interface.bbs_nodes
+
+        if is_sync_message:
+            tag, sep, payload = message.partition("|")
+            if sep:
+                handler = sync_message_handlers.get(tag)
+                if handler:
+                    handler(payload, interface)
+        else:
+            # Resolve the sender's node id and short name once; the mail and
+            # bulletin handlers all need them and shouldn't each re-derive them.
+            sender = resolve_sender(sender_id, interface)
+            for prefix, quick_handler in quick_command_handlers.items():
+                if message_lower.startswith(prefix):
+                    quick_handler(sender, sender_id, message_strip, interface, bbs_nodes)
+                    return
+
+            if command in ("JS8CALL_MENU", "GROUP_MESSAGES"):
+                state_command_handlers[command](
+                    sender, sender_id, message, state["step"], state, interface, bbs_nodes
                 )
                 return
+
+            if command == "MENU":
+                handlers = menu_tables.get(state["menu"], main_menu_handlers)
+            elif command == "BULLETIN_MENU":
+                handlers = bulletin_menu_handlers
+            elif command == "BULLETIN_ACTION":
+                handlers = board_action_handlers
             else:
                 handlers = main_menu_handlers
 
@@ -226,66 +431,26 @@ def process_message(sender_id, message, interface, is_sync_message=False):
                 return
 
             if message_lower in handlers:
-                if state and state["command"] in [
+                if command in (
                     "BULLETIN_ACTION",
                     "BULLETIN_READ",
                     "BULLETIN_POST",
                     "BULLETIN_POST_CONTENT",
-                ]:
+                ):
                     handlers[message_lower](sender_id, interface, state)
                 else:
                     handlers[message_lower](sender_id, interface)
             elif state:
-                command = state["command"]
-                step = state["step"]
-
-                if command == "MAIL":
-                    handle_mail_steps(
-                        sender_id, message, step, state, interface, bbs_nodes
-                    )
-                elif command == "BULLETIN":
-                    handle_bb_steps(
-                        sender_id, message, step, state, interface, bbs_nodes
-                    )
-                elif command == "STATS":
-                    handle_stats_steps(sender_id, message, step, interface)
-                elif command == "CHANNEL_DIRECTORY":
-                    handle_channel_directory_steps(
-                        sender_id, message, step, state, interface
-                    )
-                elif command == "CHECK_MAIL":
-                    if step == 1:
-                        handle_read_mail_command(sender_id, message, state, interface)
-                    elif step == 2:
-                        handle_delete_mail_confirmation(
-                            sender_id, message, state, interface, bbs_nodes
-                        )
-                elif command == "CHECK_BULLETIN":
-                    if step == 1:
-                        handle_read_bulletin_command(
-                            sender_id, message, state, interface
-                        )
-                elif command == "CHECK_CHANNEL":
-                    if step == 1:
-                        handle_read_channel_command(
-                            sender_id, message, state, interface
-                        )
-                elif command == "LIST_CHANNELS":
-                    if step == 1:
-                        handle_read_channel_command(
-                            sender_id, message, state, interface
-                        )
-                elif command == "BULLETIN_POST":
-                    handle_bb_steps(sender_id, message, 4, state, interface, bbs_nodes)
-                elif command == "BULLETIN_POST_CONTENT":
-                    handle_bb_steps(sender_id, message, 5, state, interface, bbs_nodes)
-                elif command == "BULLETIN_READ":
-                    handle_bb_steps(sender_id, message, 3, state, interface, bbs_nodes)
-                elif command == "JS8CALL_MENU":
-                    handle_js8call_steps(sender_id, message, step, interface, state)
-                elif command == "GROUP_MESSAGES":
-                    handle_group_message_selection(
-                        sender_id, message, step, state, interface
+                step_handler = state_command_handlers.get(command)
+                if step_handler:
+                    step_handler(
+                        sender,
+                        sender_id,
+                        message,
+                        state["step"],
+                        state,
+                        interface,
+                        bbs_nodes,
                     )
                 else:
                     handle_help_command(sender_id, interface)
@@ -314,50 +479,58 @@ def on_receive(packet, interface):
     """
     try:
         if "decoded" in packet and packet["decoded"]["portnum"] == "TEXT_MESSAGE_APP":
-            message_bytes = packet["decoded"]["payload"]
-            message_string = message_bytes.decode("utf-8")
             sender_id = packet["from"]
             to_id = packet.get("to")
             sender_node_id = packet["fromId"]
+            bbs_nodes = interface.bbs_nodes
 
-            sender_short_name = get_node_short_name(sender_node_id, interface)
-            receiver_short_name = (
-                get_node_short_name(get_node_id_from_num(to_id, interface), interface)
-                if to_id
-                else "Group Chat"
-            )
-            logging.info(
-                "Received message from user '%s' (%s) to %s: %s",
-                sender_short_name,
-                sender_node_id,
-                receiver_short_name,
-                message_string,
+            # Check addressing before touching the payload: group-chat
+            # and unrelated traffic (the common case on a busy mesh)
+            # returns here without paying the decode, the node-name
+            # lookups or a per-packet log record.
+            from_bbs_node = sender_node_id in bbs_nodes
+            addressed_to_us = (
+                to_id is not None
+                and to_id != 0
+                and to_id != 255
+                and to_id == interface.myInfo.my_node_num
             )
+            if not from_bbs_node and not addressed_to_us:
+                logging.debug(
+                    "Ignoring message sent to group chat or from unknown node"
+                )
+                return
 
-            bbs_nodes = interface.bbs_nodes
-            is_sync_message = any(
-                message_string.startswith(prefix)
-                for prefix in ["BULLETIN|", "MAIL|", "DELETE_BULLETIN|", "DELETE_MAIL|"]
-            )
+            message_bytes = packet["decoded"]["payload"]
+            message_string = message_bytes.decode("utf-8")
+
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                receiver_short_name = (
+                    get_node_short_name(
+                        get_node_id_from_num(to_id, interface), interface
+                    )
+                    if to_id
+                    else "Group Chat"
+                )
+                logging.info(
+                    "Received message from user '%s' (%s) to %s: %s",
+                    get_node_short_name(sender_node_id, interface),
+                    sender_node_id,
+                    receiver_short_name,
+                    message_string,
+                )
 
-            if sender_node_id in bbs_nodes:
-                if is_sync_message:
+            if from_bbs_node:
+                if message_string.startswith(SYNC_PREFIXES):
                     process_message(
                         sender_id, message_string, interface, is_sync_message=True
                     )
                 else:
                     logging.info("Ignoring non-sync message from known BBS node")
-            elif (
-                to_id is not None
-                and to_id != 0
-                and to_id != 255
-                and to_id == interface.myInfo.my_node_num
-            ):
+            else:
                 process_message(
                     sender_id, message_string, interface, is_sync_message=False
                 )
-            else:
-                logging.info("Ignoring message sent to group chat or from unknown node")
     except KeyError as e:
         logging.error("Error processing packet: %s", e)
 
@@ -13,7 +13,7 @@ other BBS servers listed in the config.ini file.
 """
 
 import logging
-import time
+import threading
 
 from config_init import initialize_config, get_interface, init_cli_parser, merge_config
 from db_operations import initialize_database
@@ -82,7 +82,9 @@ def main():
     )
 
     interface = get_interface(system_config)
-    interface.bbs_nodes = system_config["bbs_nodes"]
+    # frozenset: on_receive tests membership per packet; the fan-out
+    # helpers only iterate, which sets support unchanged.
+    interface.bbs_nodes = frozenset(system_config["bbs_nodes"])
     interface.allowed_nodes = system_config["allowed_nodes"]
 
     logging.info(
@@ -106,9 +108,9 @@ def main():
         js8call_client.connect()
 
     try:
-        while True:
-            time.sleep(1)
-
+        # Sleep until interrupted instead of waking every second; the
+        # worker threads carry all the actual activity.
+        threading.Event().wait()
     except KeyboardInterrupt:
         logging.info("Shutting down the server...")
         interface.close()
@@ -3,30 +3,163 @@ General utilities.
 """
 
 import logging
+import queue
+import sys
+import threading
 import time
 import os
+from collections import deque
+from contextlib import contextmanager
 from typing import Any, Dict, List
 
-user_states = {}
+
+class StateStore:
+    """
+    Thread-safe store for per-user conversation state.
+
+    Plain reads stay lock-free (single dict operations are atomic under
+    the GIL); writes and multi-step read-then-write transitions take an
+    RLock so a state observed at dispatch time cannot be swapped out by
+    another thread mid-transition. The lock is re-entrant, so handlers
+    running inside a transition may call update normally.
+    """
+
+    def __init__(self):
+        self._states: Dict[Any, Any] = {}
+        self._lock = threading.RLock()
+
+    def get(self, user_id):
+        """
+        Return the state for a user, or None if there is none.
+        """
+        return self._states.get(user_id)
+
+    def update(self, user_id, state):
+        """
+        Replace the state for a user.
+        """
+        with self._lock:
+            self._states[user_id] = state
+
+    @contextmanager
+    def transition(self, user_id):
+        """
+        Yield the user's current state while holding the store lock, so
+        the read and any updates made inside the block are atomic.
+        """
+        with self._lock:
+            yield self._states.get(user_id)
+
+
+user_states = StateStore()
+
+# Radio pacing: chunks per message and the minimum spacing between
+# transmissions to the same destination.
+MAX_PAYLOAD_SIZE = 200
+SEND_INTERVAL = 2.0
+
+# Outbound chunks flow through this queue to a single worker thread that
+# paces each destination independently, so callers never block on the
+# radio and fan-out to N nodes overlaps instead of serializing.
+_send_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _deliver_chunk(chunk, destination, interface) -> None:
+    """
+    Transmit one chunk over the interface and log the send.
+
+    Args:
+        chunk (str): The chunk of message text to transmit.
+        destination (int): The destination ID for the chunk.
+        interface: The interface object used to send the message.
+    """
+    try:
+        message_sent = interface.sendText(
+            text=chunk, destinationId=destination, wantAck=True, wantResponse=False
+        )
+        # The node lookups and newline escaping exist purely for the log
+        # line; skip them entirely when INFO is filtered out.
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            node_id = get_node_id_from_num(destination, interface)
+            logging.info(
+                "Sending message to user '%s' (%s) with sendID %s: \"%s\"",
+                get_node_short_name(node_id, interface),
+                node_id,
+                message_sent.id,
+                chunk.replace("\n", "\\n"),
+            )
+    except Exception as e:  # pylint: disable = broad-except
+        # The worker thread owns all outbound traffic; any exception that
+        # escaped here would kill it and silently mute every send.
+        logging.exception("REPLY SEND ERROR %s", str(e))
+
+
+def _send_worker() -> None:
+    """
+    Drain the send queue, pacing each destination independently.
+
+    Chunks are buffered per destination and one is transmitted whenever
+    its destination's next-allowed time has passed, so the SEND_INTERVAL
+    gaps for different nodes overlap: a fan-out to N nodes takes roughly
+    the time of the slowest node instead of the sum of all of them.
+    Order is preserved per destination.
+    """
+    pending: Dict[Any, deque] = {}
+    next_allowed: Dict[Any, float] = {}
+    while True:
+        timeout = None
+        if pending:
+            now = time.monotonic()
+            ready = None
+            earliest = None
+            for dest in pending:
+                allowed = next_allowed.get(dest, 0.0)
+                if allowed <= now:
+                    ready = dest
+                    break
+                if earliest is None or allowed < earliest:
+                    earliest = allowed
+            if ready is not None:
+                chunk, interface = pending[ready].popleft()
+                if not pending[ready]:
+                    del pending[ready]
+                _deliver_chunk(chunk, ready, interface)
+                next_allowed[ready] = time.monotonic() + SEND_INTERVAL
+                continue
+            timeout = earliest - now
+        try:
+            chunk, destination, interface = _send_queue.get(timeout=timeout)
+        except queue.Empty:
+            continue
+        pending.setdefault(destination, deque()).append((chunk, interface))
+
+
+threading.Thread(target=_send_worker, daemon=True).start()
+
+
+# On Windows an empty os.system call enables ANSI escape handling in the
+# console; Unix terminals handle the escapes natively.
+if os.name == "nt":
+    os.system("")
 
 
 def clear_screen():
     """
     Clears the terminal screen.
 
-    This function clears the terminal screen by executing the appropriate
-    system command based on the operating system. It uses 'cls' for Windows
-    and 'clear' for Unix-based systems.
+    Writes the ANSI clear-and-home escape sequence directly instead of
+    forking a shell for cls/clear, which costs a subprocess per call.
 
     Returns:
         None
     """
-    os.system("cls" if os.name == "nt" else "clear")
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
 def update_user_state(user_id, state):
     """
-    Update the state of a user in the user_states dictionary.
+    Update the state of a user in the user state store.
 
     Args:
         user_id (str): The unique identifier of the user.
@@ -35,7 +168,7 @@ def update_user_state(user_id, state):
     Returns:
         None
     """
-    user_states[user_id] = state
+    user_states.update(user_id, state)
 
 
 def get_user_state(user_id) -> str | None:
@@ -48,12 +181,32 @@ def get_user_state(user_id) -> str | None:
     Returns:
         The state of the user as a string if found, otherwise None.
     """
-    return user_states.get(user_id, None)
+    return user_states.get(user_id)
+
+
+def user_state_transition(user_id):
+    """
+    Context manager yielding the user's state with the store lock held.
+
+    Use around read-then-dispatch sequences so the observed state and
+    the updates the dispatched handler makes are one atomic step.
+
+    Args:
+        user_id: The unique identifier of the user.
+
+    Returns:
+        A context manager yielding the current state (or None).
+    """
+    return user_states.transition(user_id)
 
 
 def send_message(message, destination, interface) -> None:
     """
-    Sends a message to a specified destination using the provided interface. The message is split into chunks if it exceeds the maximum payload size.
+    Queues a message for delivery to the specified destination. The message is split into chunks if it exceeds the maximum payload size.
+
+    Chunks are handed to the background send worker, which transmits them
+    in order while enforcing SEND_INTERVAL between sends to the same
+    destination, so this call returns immediately.
 
     Args:
         message (str): The message to be sent.
@@ -63,32 +216,128 @@ def send_message(message, destination, interface) -> None:
     Returns:
         None
 
-    Raises:
-        Exception: If there is an error while sending the message.
-
     Logs:
-        Info: Logs the details of the message being sent.
+        Info: Logs the details of each chunk as the worker sends it.
         Error: Logs any errors encountered during the sending process.
     """
-    max_payload_size = 200
-    for i in range(0, len(message), max_payload_size):
-        chunk = message[i : i + max_payload_size]
-        try:
-            message_sent = interface.sendText(
-                text=chunk, destinationId=destination, wantAck=True, wantResponse=False
-            )
-            node_id = get_node_id_from_num(destination, interface)
-            chunk = chunk.replace("\n", "\\n")
-            logging.info(
-                "Sending message to user '%s' (%s) with sendID %s: \"%s\"",
-                get_node_short_name(node_id, interface),
-                node_id,
-                message_sent.id,
-                chunk,
-            )
-        except (ConnectionError, TimeoutError, ValueError) as e:
-            logging.error("REPLY SEND ERROR %s", str(e))
-        time.sleep(2)
+    for i in range(0, len(message), MAX_PAYLOAD_SIZE):
+        _send_queue.put((message[i : i + MAX_PAYLOAD_SIZE], destination, interface))
+
+
+def send_message_batch(lines, destination, interface, max_bytes=200) -> None:
+    """
+    Sends a list of lines as few coalesced messages instead of one message per line.
+
+    Lines are joined with newlines and flushed whenever adding another line
+    would exceed the maximum payload size, so N list entries cost roughly
+    N * line_length / max_bytes radio frames instead of N.
+
+    Args:
+        lines (list of str): The lines to be sent.
+        destination (int): The destination ID to which the lines should be sent.
+        interface: The interface object used to send the messages.
+        max_bytes (int, optional): The maximum payload size per message. Defaults to 200.
+
+    Returns:
+        None
+    """
+    chunk: List[str] = []
+    size = 0
+    for line in lines:
+        line_bytes = len(line.encode("utf-8"))
+        if chunk and size + line_bytes + 1 > max_bytes:
+            send_message("\n".join(chunk), destination, interface)
+            chunk = []
+            size = 0
+        chunk.append(line)
+        size += line_bytes + 1
+    if chunk:
+        send_message("\n".join(chunk), destination, interface)
+
+
+class MessageBatch:
+    """
+    Accumulates outbound messages and flushes them in one pass on exit.
+
+    Messages queued for the same recipient are merged into a single
+    transmission separated by blank lines, so handlers that emit several
+    back-to-back messages pay the per-send radio overhead and pacing
+    delay once instead of once per message.
+
+    Usage:
+        with MessageBatch(interface) as batch:
+            batch.send(body, sender_id)
+            batch.send(prompt, sender_id)
+    """
+
+    def __init__(self, interface):
+        self.interface = interface
+        self._pending: List[tuple] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        return False
+
+    def send(self, text, destination) -> None:
+        """
+        Queue a message for delivery when the batch flushes.
+
+        Args:
+            text (str): The message to be sent.
+            destination (int): The destination ID for the message.
+        """
+        self._pending.append((destination, text))
+
+    def flush(self) -> None:
+        """
+        Merge queued messages per recipient and send each merged message.
+        """
+        merged: Dict[Any, List[str]] = {}
+        for destination, text in self._pending:
+            merged.setdefault(destination, []).append(text)
+        self._pending.clear()
+        for destination, texts in merged.items():
+            send_message("\n\n".join(texts), destination, self.interface)
+
+
+# Cache of the short-name index, fingerprinted on the node table so it is
+# rebuilt lazily whenever the set of known nodes changes.
+_shortname_index: Dict[str, List[Dict[str, Any]]] = {}
+_shortname_index_key: tuple = (None, -1)
+
+
+def _build_shortname_index(interface) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build or fetch the cached index of nodes keyed by lowercased short name.
+
+    The index turns the per-lookup linear scan of interface.nodes into a
+    single dict lookup. It is rebuilt only when the node table fingerprint
+    (identity and size) changes.
+
+    Args:
+        interface: The interface object containing node information.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Node info lists keyed by lowercased short name.
+    """
+    global _shortname_index, _shortname_index_key
+    key = (id(interface.nodes), len(interface.nodes))
+    if key != _shortname_index_key:
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for node_id, node in interface.nodes.items():
+            entry = {
+                "num": node_id,
+                "shortName": node["user"]["shortName"],
+                "longName": node["user"]["longName"],
+            }
+            index.setdefault(node["user"]["shortName"].lower(), []).append(entry)
+        _shortname_index = index
+        _shortname_index_key = key
+    return _shortname_index
 
 
 def get_node_info(interface, short_name) -> List[Dict[str, Any]]:
@@ -103,16 +352,32 @@ def get_node_info(interface, short_name) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of dictionaries containing node information,
                               where each dictionary has the keys 'num', 'shortName', and 'longName'.
     """
-    nodes = [
-        {
-            "num": node_id,
-            "shortName": node["user"]["shortName"],
-            "longName": node["user"]["longName"],
+    return _build_shortname_index(interface).get(short_name, [])
+
+
+# Cache of the node-number index, fingerprinted like the short-name index.
+_num_index: Dict[Any, str] = {}
+_num_index_key: tuple = (None, -1)
+
+
+def _build_num_index(interface) -> Dict[Any, str]:
+    """
+    Build or fetch the cached reverse index of node IDs keyed by node number.
+
+    Args:
+        interface: The interface object containing node information.
+
+    Returns:
+        Dict[Any, str]: Node IDs keyed by node number.
+    """
+    global _num_index, _num_index_key
+    key = (id(interface.nodes), len(interface.nodes))
+    if key != _num_index_key:
+        _num_index = {
+            node["num"]: node_id for node_id, node in interface.nodes.items()
         }
-        for node_id, node in interface.nodes.items()
-        if node["user"]["shortName"].lower() == short_name
-    ]
-    return nodes
+        _num_index_key = key
+    return _num_index
 
 
 def get_node_id_from_num(node_num, interface) -> str | None:
@@ -126,10 +391,7 @@ def get_node_id_from_num(node_num, interface) -> str | None:
     Returns:
         str | None: The node ID if found, otherwise None.
     """
-    for node_id, node in interface.nodes.items():
-        if node["num"] == node_num:
-            return node_id
-    return None
+    return _build_num_index(interface).get(node_num)
 
 
 def get_node_short_name(node_id, interface) -> str | None:
@@ -167,7 +429,13 @@ def send_bulletin_to_bbs_nodes(
     Returns:
         None
     """
-    message = f"BULLETIN|{board}|{sender_short_name}|{subject}|{content}|{unique_id}"
+    # One join over a tuple instead of f-string interpolation: a single
+    # C-level pass however many fields the sync frame carries. map(str, ...)
+    # keeps the f-string's coercion: callers pass ints and None for some
+    # fields, which join alone would reject.
+    message = "|".join(
+        map(str, ("BULLETIN", board, sender_short_name, subject, content, unique_id))
+    )
     for node_id in bbs_nodes:
         send_message(message, node_id, interface)
 
@@ -198,7 +466,20 @@ def send_mail_to_bbs_nodes(
     Returns:
         None
     """
-    message = f"MAIL|{sender_id}|{sender_short_name}|{recipient_id}|{subject}|{content}|{unique_id}"
+    message = "|".join(
+        map(
+            str,
+            (
+                "MAIL",
+                sender_id,
+                sender_short_name,
+                recipient_id,
+                subject,
+                content,
+                unique_id,
+            ),
+        )
+    )
     logging.info(
         "SERVER SYNC: Syncing new mail message %s sent from %s to other BBS systems.",
         subject,
@@ -258,7 +539,7 @@ def send_channel_to_bbs_nodes(name, url, bbs_nodes, interface) -> None:
     Returns:
         None
     """
-    message = f"CHANNEL|{name}|{url}"
+    message = "|".join(map(str, ("CHANNEL", name, url)))
     for node_id in bbs_nodes:
         send_message(message, node_id, interface)
 